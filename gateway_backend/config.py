@@ -2,54 +2,266 @@
 Configuration and AWS client initialization for Books API Lambda handlers
 
 This module provides:
-- AWS service clients (S3, DynamoDB)
+- AWS service clients (S3, DynamoDB, SQS)
 - Environment variable configuration
 - Constants used across handlers
 """
 
 from __future__ import annotations
 
+import functools
+import logging
 import os
-from typing import TYPE_CHECKING
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
 import boto3
 from botocore.config import Config
 
+logger = logging.getLogger()
+
 if TYPE_CHECKING:
+    from mypy_boto3_dynamodb.client import DynamoDBClient
     from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource, Table
     from mypy_boto3_s3.client import S3Client
+    from mypy_boto3_sqs.client import SQSClient
 
 # Constants
 URL_EXPIRY_SECONDS = 3600  # 1 hour for presigned URLs
+URL_CACHE_MIN_REMAINING_SECONDS = 900  # Reuse a cached download URL while it has 15+ minutes left
+URL_CACHE_MAX_ENTRIES = 1024
 MAX_STRING_LENGTH = 500  # Maximum length for string fields
 MAX_FILE_SIZE_BYTES = 5 * 1024 * 1024 * 1024  # 5GB
 MAX_SERIES_ORDER = 100
 MIN_SERIES_ORDER = 1
+MAX_PAGE_SIZE = 100  # Maximum books per page when listing with a limit
+BATCH_GET_MAX_KEYS = 100  # DynamoDB BatchGetItem limit per request
+MAX_BATCH_BOOK_IDS = 500  # Maximum book IDs accepted by the batch endpoint
+BOOK_ENTITY_TYPE = "book"  # Constant partition key value for the created-date index
+
+AWS_REGION = "us-east-2"
 
-# Initialize AWS clients with type hints
-s3_client: "S3Client" = boto3.client(
-    "s3",
-    region_name="us-east-2",
-    endpoint_url="https://s3.us-east-2.amazonaws.com",
-    config=Config(signature_version="s3v4"),
+# Shared botocore settings: a pool large enough for the parallel scan/presign paths,
+# keep-alive so warm invocations reuse TCP/TLS sessions, and bounded retries/timeouts
+CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={"mode": "adaptive", "max_attempts": 3},
+    connect_timeout=1,
+    read_timeout=3,
 )
-dynamodb: "DynamoDBServiceResource" = boto3.resource("dynamodb", region_name="us-east-2")
+
+# Serializes client/resource creation: boto3's default session is not thread-safe, and the
+# first access to a lazy client can come from several executor threads at once
+_CLIENT_LOCK = threading.RLock()
+
+
+@functools.cache
+def get_s3_client() -> S3Client:
+    """
+    Get the shared S3 client (created once per container).
+
+    Returns:
+        S3Client: boto3 S3 client using SigV4 and virtual-hosted addressing
+    """
+    # Virtual-hosted addressing (<bucket>.s3.<region>.amazonaws.com); the template
+    # restricts bucket names to DNS-compatible ones without dots
+    with _CLIENT_LOCK:
+        return boto3.client(
+            "s3",
+            region_name=AWS_REGION,
+            config=CLIENT_CONFIG.merge(
+                Config(signature_version="s3v4", s3={"addressing_style": "virtual"})
+            ),
+        )
+
+
+@functools.cache
+def get_sqs_client() -> SQSClient:
+    """
+    Get the shared SQS client (created once per container).
+
+    Returns:
+        SQSClient: boto3 SQS client
+    """
+    with _CLIENT_LOCK:
+        return boto3.client("sqs", region_name=AWS_REGION, config=CLIENT_CONFIG)
+
+
+@functools.cache
+def get_signing_credentials() -> Any:
+    """
+    Get credentials for presigning S3 URLs locally (resolved once per container).
+
+    Returns:
+        Credentials or None if no credentials are configured
+    """
+    with _CLIENT_LOCK:
+        return boto3.Session().get_credentials()
+
+
+@functools.cache
+def get_dynamodb_resource() -> DynamoDBServiceResource:
+    """
+    Get the shared DynamoDB resource (created once per container).
+
+    Returns:
+        DynamoDBServiceResource: boto3 DynamoDB resource
+    """
+    with _CLIENT_LOCK:
+        return boto3.resource("dynamodb", region_name=AWS_REGION, config=CLIENT_CONFIG)
+
+
+# AWS clients and table handles are created on first access (see __getattr__ below),
+# so each function only loads the service models it actually uses - e.g. the book
+# read paths presign locally and never build an S3 client
+s3_client: S3Client
+dynamodb: DynamoDBServiceResource
+# Low-level client (shares the resource's connection pool) for hot paths that
+# deserialize raw attribute values themselves
+dynamodb_client: DynamoDBClient
+sqs_client: SQSClient
+
+# Shared thread pool for concurrent AWS calls (survives across warm invocations)
+executor = ThreadPoolExecutor(max_workers=8)
+
+
+def _env_int(name: str, default: int, minimum: int = 1) -> int:
+    """
+    Read an optional integer setting from the environment.
+
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset or not an integer
+        minimum: Smallest accepted value; lower values are clamped up to it
+
+    Returns:
+        Parsed value, never below minimum
+    """
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        return max(minimum, int(raw))
+    except ValueError:
+        logger.warning(f"Invalid {name} value {raw!r}, using {default}")
+        return default
+
 
 # Environment configuration
 BUCKET_NAME = os.environ.get("BUCKET_NAME", "YOUR_BUCKET")
 BOOKS_PREFIX = os.environ.get("BOOKS_PREFIX", "books/")
 BOOKS_TABLE_NAME = os.environ.get("BOOKS_TABLE")
 USER_BOOKS_TABLE_NAME = os.environ.get("USER_BOOKS_TABLE")
+# GSI on Books (PK: entity_type, SK: created); list falls back to a scan when unset
+BOOKS_CREATED_INDEX = os.environ.get("BOOKS_CREATED_INDEX")
+# GSI on UserBooks (PK: bookId, keys only); book deletion falls back to a scan when unset
+USER_BOOKS_BOOK_INDEX = os.environ.get("USER_BOOKS_BOOK_INDEX")
+# Queue for deferred UserBooks cleanup after a book is deleted; cleanup runs inline when unset
+USER_BOOKS_CLEANUP_QUEUE_URL = os.environ.get("USER_BOOKS_CLEANUP_QUEUE_URL")
+# Parallel scan segments for reads that fall back to a scan without their index (raise as tables grow)
+SCAN_TOTAL_SEGMENTS = _env_int("SCAN_SEGMENTS", 4)
+# Handler log level, applied once at import (e.g. DEBUG, INFO, WARNING)
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+
+# DynamoDB tables (None when the env var is unset; tests mock these)
+books_table: Table
+user_books_table: Table
+
+
+def _get_table(table_name: str | None) -> Table:
+    """
+    Get a DynamoDB Table handle for a configured table name.
+
+    Args:
+        table_name: Table name from the environment
+
+    Returns:
+        Table, or None if the table is not configured for this function
+    """
+    if not table_name:
+        return None  # type: ignore[return-value]
+    return get_dynamodb_resource().Table(table_name)
+
+
+_LAZY_ATTRIBUTES = frozenset(
+    {"s3_client", "dynamodb", "dynamodb_client", "sqs_client", "books_table", "user_books_table"}
+)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Create AWS clients and table handles on first module attribute access.
+
+    The value is stored as a module global, so later lookups are plain
+    attribute reads that survive across warm invocations. Creation holds
+    _CLIENT_LOCK, so threads racing on the first access share one handle.
+
+    Args:
+        name: Attribute name
+
+    Returns:
+        The client or table handle
+
+    Raises:
+        AttributeError: If the attribute is not a lazily created client
+    """
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    with _CLIENT_LOCK:
+        if name in globals():  # Created by another thread while we waited
+            return globals()[name]
+        if name == "s3_client":
+            value: Any = get_s3_client()
+        elif name == "dynamodb":
+            value = get_dynamodb_resource()
+        elif name == "dynamodb_client":
+            value = get_dynamodb_resource().meta.client
+        elif name == "sqs_client":
+            value = get_sqs_client()
+        elif name == "books_table":
+            value = _get_table(BOOKS_TABLE_NAME)
+        else:
+            value = _get_table(USER_BOOKS_TABLE_NAME)
+        globals()[name] = value
+        return value
+
+
+def warm_up_clients() -> None:
+    """
+    Prime AWS access so the first invocation doesn't pay cold-connection costs.
+
+    Resolves the credentials used for local presigning, creates the DynamoDB
+    client and table handles on the init thread (so executor workers never race
+    to build them), and opens the DynamoDB TLS connection with a DescribeTable per
+    configured table. The S3 client is left to be created on demand. Failures are
+    logged and ignored - warm-up is best effort.
+    """
+    try:
+        credentials = get_signing_credentials()
+        if credentials is not None:
+            credentials.get_frozen_credentials()
+    except Exception as e:
+        logger.warning(f"Credential warm-up failed: {str(e)}")
+
+    try:
+        for name in ("dynamodb", "dynamodb_client", "books_table", "user_books_table"):
+            getattr(sys.modules[__name__], name)
+    except Exception as e:
+        logger.warning(f"DynamoDB client warm-up failed: {str(e)}")
+
+    for table_name in (BOOKS_TABLE_NAME, USER_BOOKS_TABLE_NAME):
+        if not table_name:
+            continue
+        try:
+            get_dynamodb_resource().meta.client.describe_table(TableName=table_name)
+        except Exception as e:
+            logger.warning(f"DynamoDB warm-up failed for {table_name}: {str(e)}")
+
 
-# Initialize DynamoDB tables
-# For type checking: treat as non-None (tests will mock these)
-# For production: Lambda environment must have these env vars set
-if BOOKS_TABLE_NAME:
-    books_table: "Table" = dynamodb.Table(BOOKS_TABLE_NAME)
-else:
-    books_table = None  # type: ignore[assignment]
-
-if USER_BOOKS_TABLE_NAME:
-    user_books_table: "Table" = dynamodb.Table(USER_BOOKS_TABLE_NAME)
-else:
-    user_books_table = None  # type: ignore[assignment]
+# Warm up during Lambda INIT only (not when imported by tests or scripts)
+if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+    warm_up_clients()
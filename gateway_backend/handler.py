@@ -13,11 +13,13 @@ Architecture:
 Handlers:
 1. list_handler: Lists all books from DynamoDB with user-specific read status
 2. get_book_handler: Gets book metadata and generates presigned S3 download URL
-3. update_book_handler: Updates book metadata (e.g., read status, author, series)
-4. delete_book_handler: Deletes book from both DynamoDB and S3 (admin only)
-5. upload_handler: Generates presigned S3 upload URL for authenticated admin users
-6. set_upload_metadata_handler: Sets author/series metadata after upload completes (admin only)
-7. s3_trigger_handler: Auto-populates DynamoDB when books are uploaded to S3
+3. get_books_batch_handler: Gets several books with presigned download URLs in one call
+4. update_book_handler: Updates book metadata (e.g., read status, author, series)
+5. delete_book_handler: Deletes book from both DynamoDB and S3 (admin only)
+6. upload_handler: Generates presigned S3 upload URL for authenticated admin users
+7. set_upload_metadata_handler: Sets author/series metadata after upload completes (admin only)
+8. s3_trigger_handler: Auto-populates DynamoDB when books are uploaded to S3
+9. user_books_cleanup_handler: Removes a deleted book's UserBooks entries (SQS)
 
 Updated: 2025-10-23 - Refactored into modular structure
 """
@@ -26,36 +28,55 @@ Updated: 2025-10-23 - Refactored into modular structure
 # Support both local development (gateway_backend.X) and Lambda deployment (X)
 try:
     # Lambda deployment (files are in root, not in gateway_backend/)
-    from handlers.admin_handlers import delete_book_handler, upload_handler
+    import config
+    from handlers.admin_handlers import (
+        delete_book_handler,
+        upload_handler,
+        user_books_cleanup_handler,
+    )
     from handlers.book_handlers import (
         get_book_handler,
+        get_books_batch_handler,
         list_handler,
         update_book_handler,
     )
     from handlers.s3_handlers import s3_trigger_handler, set_upload_metadata_handler
-    from config import books_table, s3_client, user_books_table
 except ImportError:
     # Local development / testing (with gateway_backend package structure)
-    from gateway_backend.handlers.admin_handlers import delete_book_handler, upload_handler
+    import gateway_backend.config as config
+    from gateway_backend.handlers.admin_handlers import (
+        delete_book_handler,
+        upload_handler,
+        user_books_cleanup_handler,
+    )
     from gateway_backend.handlers.book_handlers import (
         get_book_handler,
+        get_books_batch_handler,
         list_handler,
         update_book_handler,
     )
     from gateway_backend.handlers.s3_handlers import s3_trigger_handler, set_upload_metadata_handler
-    from gateway_backend.config import books_table, s3_client, user_books_table
 
 # Make handlers available at module level for Lambda
 __all__ = [
     "list_handler",
     "get_book_handler",
+    "get_books_batch_handler",
     "update_book_handler",
     "delete_book_handler",
     "upload_handler",
     "set_upload_metadata_handler",
     "s3_trigger_handler",
+    "user_books_cleanup_handler",
     # Also export config for tests
-    "books_table",
-    "user_books_table",
-    "s3_client",
+    "books_table",  # noqa: F822 - resolved lazily by __getattr__
+    "user_books_table",  # noqa: F822
+    "s3_client",  # noqa: F822
 ]
+
+
+def __getattr__(name: str):
+    """Resolve the re-exported config clients lazily so importing handlers doesn't create them."""
+    if name in ("books_table", "user_books_table", "s3_client"):
+        return getattr(config, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,59 +6,192 @@ These handlers require admin role and provide book management operations.
 
 from __future__ import annotations
 
+import json
 import logging
 import os
-from urllib.parse import quote_plus, urlparse
+import re
+from collections.abc import Callable
+from typing import Any
+from urllib.parse import quote_plus
 
 from botocore.exceptions import ClientError
+from urllib3.exceptions import HTTPError
 
 # Support both Lambda deployment and local development
 try:
     # Lambda deployment
     import config
-    from utils.auth import get_user_id, is_admin
-    from utils.response import api_response, error_response
-    from utils.validation import get_path_param, parse_json_body, validate_series_order, validate_string_field
+    from utils.auth import get_claims, get_user_context, is_admin_from_claims
+    from utils.response import api_response, error_response, unauthorized_response
+    from utils.s3 import delete_object, get_book_s3_location, presign_put_object
+    from utils.validation import (
+        get_path_param,
+        parse_json_body,
+        validate_series_order,
+        validate_string_field,
+    )
 except ImportError:
     # Local development
     import gateway_backend.config as config
-    from gateway_backend.utils.auth import get_user_id, is_admin
-    from gateway_backend.utils.response import api_response, error_response
-    from gateway_backend.utils.validation import get_path_param, parse_json_body, validate_series_order, validate_string_field
+    from gateway_backend.utils.auth import get_claims, get_user_context, is_admin_from_claims
+    from gateway_backend.utils.response import api_response, error_response, unauthorized_response
+    from gateway_backend.utils.s3 import delete_object, get_book_s3_location, presign_put_object
+    from gateway_backend.utils.validation import (
+        get_path_param,
+        parse_json_body,
+        validate_series_order,
+        validate_string_field,
+    )
 
 logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+logger.setLevel(config.LOG_LEVEL)
+
+# Allowed upload file types (case-insensitive suffix match without lowercasing a copy)
+_UPLOAD_SUFFIX_RE = re.compile(r"\.zip\Z", re.IGNORECASE)
+
+
+def _presign_upload(s3_key: str, content_type: str, tagging: str) -> str:
+    """
+    Presign an upload URL, signing locally when credentials are available.
+
+    Args:
+        s3_key: S3 object key
+        content_type: Content-Type the upload must be sent with
+        tagging: URL-encoded S3 object tags (empty for none)
+
+    Returns:
+        str: Presigned PUT URL valid for URL_EXPIRY_SECONDS
+    """
+    credentials = config.get_signing_credentials()
+    if credentials is not None:
+        return presign_put_object(
+            credentials,
+            config.AWS_REGION,
+            config.BUCKET_NAME,
+            s3_key,
+            config.URL_EXPIRY_SECONDS,
+            content_type,
+            tagging or None,
+        )
+
+    params = {
+        "Bucket": config.BUCKET_NAME,
+        "Key": s3_key,
+        "ContentType": content_type,
+    }
+    if tagging:
+        params["Tagging"] = tagging
+    return config.s3_client.generate_presigned_url(
+        "put_object",
+        Params=params,
+        ExpiresIn=config.URL_EXPIRY_SECONDS,
+    )
 
 
-def _delete_s3_object(s3_url: str) -> None:
+def _delete_s3_object(bucket: str, s3_key: str) -> None:
     """
-    Delete an object from S3.
+    Delete an object from S3, signing locally when credentials are available.
 
     Args:
-        s3_url: S3 URL (format: s3://bucket/key)
+        bucket: S3 bucket name
+        s3_key: S3 object key
 
     Raises:
         ClientError: If S3 deletion fails (logged but not fatal)
     """
     try:
-        # Parse S3 URL to get bucket and key
-        # Format: s3://bucket-name/path/to/object
-        parsed_url = urlparse(str(s3_url))  # type: ignore[arg-type]
-        bucket = parsed_url.netloc
-        s3_key = parsed_url.path.lstrip("/")
-
         logger.info(f"Deleting S3 object: s3://{bucket}/{s3_key}")
 
-        config.s3_client.delete_object(Bucket=bucket, Key=s3_key)
+        credentials = config.get_signing_credentials()
+        if credentials is not None:
+            try:
+                status = delete_object(credentials, config.AWS_REGION, bucket, s3_key)
+            except HTTPError as e:
+                raise ClientError(
+                    {"Error": {"Code": "RequestError", "Message": str(e)}}, "DeleteObject"
+                ) from e
+            if status not in (200, 204, 404):
+                raise ClientError(
+                    {"Error": {"Code": str(status), "Message": f"HTTP {status}"}}, "DeleteObject"
+                )
+        else:
+            config.s3_client.delete_object(Bucket=bucket, Key=s3_key)
 
         logger.info(f"Successfully deleted S3 object: {s3_key}")
 
-    except ClientError as e:
+    except ClientError:
         # Log error but don't fail the entire operation
-        logger.error(f"S3 deletion error: {str(e)}", exc_info=True)
+        logger.exception("S3 deletion error")
         raise
 
 
+def _read_all_pages(read: Callable[..., dict], read_kwargs: dict[str, Any]) -> list[dict]:
+    """
+    Run a Query or Scan, following LastEvaluatedKey until the last page.
+
+    Args:
+        read: Table query or scan method
+        read_kwargs: Request parameters (not modified)
+
+    Returns:
+        list: Items from every page
+    """
+    read_kwargs = dict(read_kwargs)
+    items: list[dict] = []
+    while True:
+        response = read(**read_kwargs)
+        items.extend(response.get("Items", []))
+        if "LastEvaluatedKey" not in response:
+            return items
+        read_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def _find_user_book_keys(book_id: str) -> list[dict]:
+    """
+    Find the keys of every UserBooks entry for a book.
+
+    Queries the bookId index when configured, otherwise runs a parallel
+    segmented scan (bookId is only the sort key of the table).
+
+    Args:
+        book_id: Book identifier
+
+    Returns:
+        list: UserBooks primary keys ({"userId", "bookId"}) - items hold exactly
+              the key attributes (projection), so they are used as-is
+    """
+    read_kwargs: dict[str, Any] = {
+        "ExpressionAttributeValues": {":bid": book_id},
+        "ProjectionExpression": "userId, bookId",
+    }
+
+    if config.USER_BOOKS_BOOK_INDEX:
+        return _read_all_pages(
+            config.user_books_table.query,
+            {
+                **read_kwargs,
+                "IndexName": config.USER_BOOKS_BOOK_INDEX,
+                "KeyConditionExpression": "bookId = :bid",
+            },
+        )
+
+    total_segments = config.SCAN_TOTAL_SEGMENTS
+    futures = [
+        config.executor.submit(
+            _read_all_pages,
+            config.user_books_table.scan,
+            {
+                **read_kwargs,
+                "FilterExpression": "bookId = :bid",
+                "Segment": segment,
+                "TotalSegments": total_segments,
+            },
+        )
+        for segment in range(total_segments)
+    ]
+    return [key for future in futures for key in future.result()]
+
+
 def _cleanup_user_books(book_id: str) -> int:
     """
     Delete all UserBooks entries for a specific book.
@@ -73,47 +206,68 @@ def _cleanup_user_books(book_id: str) -> int:
         ClientError: If UserBooks cleanup fails (logged but not fatal)
     """
     try:
-        # Query all users who have this book in their UserBooks table
-        # We need to scan since we're querying by bookId (which is the sort key)
-        scan_response = config.user_books_table.scan(
-            FilterExpression="bookId = :bid", ExpressionAttributeValues={":bid": book_id}
-        )
-
-        user_book_items = scan_response.get("Items", [])
-
-        # Delete each user's entry for this book
-        for item in user_book_items:
-            config.user_books_table.delete_item(
-                Key={"userId": item["userId"], "bookId": item["bookId"]}
-            )
+        user_book_keys = _find_user_book_keys(book_id)
 
-        if user_book_items:
-            logger.info(
-                f"Deleted {len(user_book_items)} UserBooks entries for book: {book_id}"
-            )
+        if user_book_keys:
+            # batch_writer sends 25 deletes per BatchWriteItem and retries unprocessed items
+            with config.user_books_table.batch_writer(
+                overwrite_by_pkeys=["userId", "bookId"]
+            ) as batch:
+                for key in user_book_keys:
+                    batch.delete_item(Key=key)
+            logger.info(f"Deleted {len(user_book_keys)} UserBooks entries for book: {book_id}")
 
-        return len(user_book_items)
+        return len(user_book_keys)
 
-    except ClientError as e:
+    except ClientError:
         # Log error but don't fail the entire operation
-        logger.error(f"Error deleting UserBooks entries: {str(e)}", exc_info=True)
+        logger.exception("Error deleting UserBooks entries")
         raise
 
 
-def _delete_book_record(book_id: str) -> None:
+def _queue_user_books_cleanup(book_id: str) -> None:
+    """
+    Hand the UserBooks cleanup for a deleted book to the cleanup queue.
+
+    Falls back to cleaning up inline if the message can't be sent.
+
+    Args:
+        book_id: Book identifier
+
+    Raises:
+        ClientError: If the inline fallback cleanup fails (logged but not fatal)
+    """
+    try:
+        config.sqs_client.send_message(
+            QueueUrl=config.USER_BOOKS_CLEANUP_QUEUE_URL,
+            MessageBody=json.dumps({"bookId": book_id}),
+        )
+        logger.info(f"Queued UserBooks cleanup for book: {book_id}")
+    except ClientError:
+        logger.exception("Error queueing UserBooks cleanup, cleaning up inline")
+        _cleanup_user_books(book_id)
+
+
+def _delete_book_record(book_id: str) -> dict:
     """
     Delete book record from Books table.
 
     Args:
         book_id: Book identifier
 
+    Returns:
+        dict: The deleted item's attributes
+
     Raises:
         ClientError: If book not found or DynamoDB error
     """
-    config.books_table.delete_item(
-        Key={"id": book_id}, ConditionExpression="attribute_exists(id)"
+    response = config.books_table.delete_item(
+        Key={"id": book_id},
+        ConditionExpression="attribute_exists(id)",
+        ReturnValues="ALL_OLD",
     )
     logger.info(f"Successfully deleted DynamoDB record: {book_id}")
+    return response.get("Attributes", {})
 
 
 def upload_handler(event, context):
@@ -128,16 +282,12 @@ def upload_handler(event, context):
     logger.info("upload_handler invoked")
 
     try:
-        # Check if user is admin
-        if not is_admin(event):
+        # Check if user is admin (claims are read once for the check and the email)
+        claims = get_claims(event)
+        if not is_admin_from_claims(claims):
             logger.warning("Non-admin user attempted to upload")
-            return error_response(
-                403, "Forbidden", "Only administrators can upload books"
-            )
+            return error_response(403, "Forbidden", "Only administrators can upload books")
 
-        # Verify user is authenticated (Cognito authorizer adds this)
-        authorizer = event.get("requestContext", {}).get("authorizer", {})
-        claims = authorizer.get("claims", {})
         user_email = claims.get("email", "unknown")
 
         logger.info(f"Upload request from admin user: {user_email}")
@@ -154,7 +304,7 @@ def upload_handler(event, context):
             return error_response(400, "Bad Request", "filename is required")
 
         # Validate file extension
-        if not filename.lower().endswith(".zip"):
+        if not _UPLOAD_SUFFIX_RE.search(filename):
             logger.warning(f"Invalid file extension: {filename}")
             return error_response(400, "Bad Request", "Only .zip files are allowed")
 
@@ -185,9 +335,7 @@ def upload_handler(event, context):
         # Get optional file size for validation
         file_size = body.get("fileSize", 0)
         if file_size > config.MAX_FILE_SIZE_BYTES:
-            return error_response(
-                400, "Bad Request", "File size exceeds maximum limit of 5GB"
-            )
+            return error_response(400, "Bad Request", "File size exceeds maximum limit of 5GB")
 
         # Generate S3 key
         s3_key = f"{config.BOOKS_PREFIX}{filename}"
@@ -208,23 +356,11 @@ def upload_handler(event, context):
             tagging += f"series_order={series_order}"
 
         # Generate presigned PUT URL (valid for 60 minutes for large files)
-        # Include Tagging parameter to attach metadata as S3 object tags
-        params = {
-            "Bucket": config.BUCKET_NAME,
-            "Key": s3_key,
-            "ContentType": "application/zip",
-        }
-
-        # Add Tagging parameter if we have tags
+        # Tags are signed as the x-amz-tagging header to attach metadata as S3 object tags
         if tagging:
-            params["Tagging"] = tagging
             logger.info(f"Adding S3 tags to presigned URL: {tagging}")
 
-        presigned_url = config.s3_client.generate_presigned_url(
-            "put_object",
-            Params=params,
-            ExpiresIn=config.URL_EXPIRY_SECONDS,  # 60 minutes for large file uploads
-        )
+        presigned_url = _presign_upload(s3_key, "application/zip", tagging)
 
         logger.info(f"Successfully generated presigned PUT URL for {filename}")
 
@@ -250,7 +386,7 @@ def upload_handler(event, context):
         return api_response(200, response_data)
 
     except Exception as e:
-        logger.error(f"Error generating upload URL: {str(e)}", exc_info=True)
+        logger.exception("Error generating upload URL")
         return error_response(500, "Internal Server Error", str(e))
 
 
@@ -262,8 +398,8 @@ def delete_book_handler(event, context):
 
     Deletes:
     1. DynamoDB record with book metadata (Books table)
-    2. All user-specific records (UserBooks table)
-    3. S3 object (the .zip file)
+    2. All user-specific records (UserBooks table) and the S3 object (the
+       .zip file), concurrently
 
     Returns success/failure status.
     """
@@ -271,16 +407,14 @@ def delete_book_handler(event, context):
 
     try:
         # Verify user is authenticated
-        user_id = get_user_id(event)
+        user_id, user_is_admin = get_user_context(event)
         if not user_id:
-            return error_response(401, "Unauthorized", "User not authenticated")
+            return unauthorized_response()
 
         # Check if user is admin
-        if not is_admin(event):
+        if not user_is_admin:
             logger.warning(f"Non-admin user {user_id} attempted to delete book")
-            return error_response(
-                403, "Forbidden", "Only administrators can delete books"
-            )
+            return error_response(403, "Forbidden", "Only administrators can delete books")
 
         logger.info(f"Delete request from admin user: {user_id}")
 
@@ -291,55 +425,65 @@ def delete_book_handler(event, context):
 
         logger.info(f"Deleting book: {book_id}")
 
-        # First, get the book record to find the S3 URL
+        # Delete the Books record first - ALL_OLD returns the deleted item,
+        # so finding the S3 URL doesn't need a separate read
         try:
-            response = config.books_table.get_item(Key={"id": book_id})
-            if "Item" not in response:
-                logger.warning(f"Book not found: {book_id}")
-                return error_response(
-                    404, "Not Found", f'Book with id "{book_id}" not found'
-                )
-
-            book_item = response["Item"]
-            s3_url = book_item.get("s3_url")
-
+            book_item = _delete_book_record(book_id)
         except ClientError as e:
-            logger.error(f"DynamoDB error: {str(e)}", exc_info=True)
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":  # type: ignore[typeddict-item]
+                logger.warning(f"Book not found: {book_id}")
+                return error_response(404, "Not Found", f'Book with id "{book_id}" not found')
+            logger.exception("DynamoDB error")
             return error_response(500, "Database Error", str(e))
 
-        # Delete from S3 if S3 URL exists
-        if s3_url:
+        # Delete the S3 object and all UserBooks entries for this book concurrently -
+        # they touch independent services
+        # (queued for the cleanup function when configured, so the response doesn't
+        # wait on books read by many users)
+        cleanup = (
+            _queue_user_books_cleanup
+            if config.USER_BOOKS_CLEANUP_QUEUE_URL
+            else _cleanup_user_books
+        )
+        cleanup_futures = [config.executor.submit(cleanup, book_id)]
+        location = get_book_s3_location(book_item)
+        if location:
+            bucket, s3_key = location
+            cleanup_futures.append(config.executor.submit(_delete_s3_object, bucket, s3_key))
+        else:
+            logger.warning(f"No S3 URL found for book: {book_id}")
+
+        for future in cleanup_futures:
             try:
-                _delete_s3_object(s3_url)
+                future.result()
             except ClientError:
-                # Error logged in helper, continue with DynamoDB deletion
+                # Errors logged in helpers - the book is already removed from the
+                # library, and orphaned objects or read statuses are harmless
                 pass
-        else:
-            logger.warning(f"No S3 URL found for book: {book_id}")
 
-        # Delete all UserBooks entries for this book
-        try:
-            _cleanup_user_books(book_id)
-        except ClientError:
-            # Error logged in helper, continue with Books table deletion
-            pass
+        return api_response(200, {"message": "Book deleted successfully", "bookId": book_id})
 
-        # Delete from DynamoDB Books table
-        try:
-            _delete_book_record(book_id)
+    except Exception as e:
+        logger.exception("Error deleting book")
+        return error_response(500, "Internal Server Error", str(e))
 
-            return api_response(
-                200, {"message": "Book deleted successfully", "bookId": book_id}
-            )
 
-        except ClientError as e:
-            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":  # type: ignore[typeddict-item]
-                logger.warning(f"Book not found during deletion: {book_id}")
-                return error_response(
-                    404, "Not Found", f'Book with id "{book_id}" not found'
-                )
-            raise
+def user_books_cleanup_handler(event, context):
+    """
+    Lambda handler (SQS) that deletes the UserBooks entries of deleted books.
+    Each message body is {"bookId": "..."}, queued by delete_book_handler.
 
-    except Exception as e:
-        logger.error(f"Error deleting book: {str(e)}", exc_info=True)
-        return error_response(500, "Internal Server Error", str(e))
+    Returns the failed message IDs so only those are retried (partial batch response).
+    """
+    logger.info("user_books_cleanup_handler invoked")
+
+    failures = []
+    for record in event.get("Records", []):
+        try:
+            book_id = json.loads(record["body"])["bookId"]
+            _cleanup_user_books(book_id)
+        except (ClientError, KeyError, ValueError):
+            logger.exception(f"UserBooks cleanup failed for message: {record.get('messageId')}")
+            failures.append({"itemIdentifier": record.get("messageId")})
+
+    return {"batchItemFailures": failures}
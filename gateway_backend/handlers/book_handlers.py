@@ -6,10 +6,14 @@ These handlers provide CRUD operations for books that authenticated users can ac
 
 from __future__ import annotations
 
+import functools
+import heapq
 import logging
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import as_completed
 from datetime import UTC, datetime
 from typing import Any
-from urllib.parse import urlparse
 
 from botocore.exceptions import ClientError
 
@@ -17,13 +21,26 @@ from botocore.exceptions import ClientError
 try:
     # Lambda deployment
     import config
-    from utils.auth import get_user_id, is_admin
+    from utils.auth import get_user_context, get_user_id
+    from utils.cache import TTLCache
     from utils.cover import update_cover_on_author_change
-    from utils.dynamodb import build_update_expression, build_update_params
-    from utils.response import api_response, error_response, serialize_book_response
+    from utils.dynamodb import (
+        build_update_params,
+        deserialize_item,
+        encode_cursor,
+    )
+    from utils.response import (
+        api_response,
+        conditional_response,
+        error_response,
+        serialize_book_response,
+        unauthorized_response,
+    )
+    from utils.s3 import get_book_s3_location, presign_get_object
     from utils.validation import (
         get_path_param,
         parse_json_body,
+        parse_pagination_params,
         validate_boolean_field,
         validate_series_order,
         validate_string_field,
@@ -31,20 +48,396 @@ try:
 except ImportError:
     # Local development
     import gateway_backend.config as config
-    from gateway_backend.utils.auth import get_user_id, is_admin
+    from gateway_backend.utils.auth import get_user_context, get_user_id
+    from gateway_backend.utils.cache import TTLCache
     from gateway_backend.utils.cover import update_cover_on_author_change
-    from gateway_backend.utils.dynamodb import build_update_expression, build_update_params
-    from gateway_backend.utils.response import api_response, error_response, serialize_book_response
+    from gateway_backend.utils.dynamodb import (
+        build_update_params,
+        deserialize_item,
+        encode_cursor,
+    )
+    from gateway_backend.utils.response import (
+        api_response,
+        conditional_response,
+        error_response,
+        serialize_book_response,
+        unauthorized_response,
+    )
+    from gateway_backend.utils.s3 import get_book_s3_location, presign_get_object
     from gateway_backend.utils.validation import (
         get_path_param,
         parse_json_body,
+        parse_pagination_params,
         validate_boolean_field,
         validate_series_order,
         validate_string_field,
     )
 
 logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+logger.setLevel(config.LOG_LEVEL)
+
+# Only the attributes serialize_book_response and presigning use (name and size are reserved words)
+LIST_PROJECTION_EXPRESSION = "id, #n, created, s3_url, s3_bucket, s3_key, author, #s, series_name, series_order, coverImageUrl"
+LIST_PROJECTION_NAMES = {"#n": "name", "#s": "size"}
+# Single-book reads also need the presigned URL stored on the item
+GET_PROJECTION_EXPRESSION = f"{LIST_PROJECTION_EXPRESSION}, presigned_url, presigned_expires"
+
+# LastEvaluatedKey attributes of the created-date index (index keys plus the table key)
+CREATED_INDEX_KEY_ATTRIBUTES = ("entity_type", "created", "id")
+
+BATCH_GET_MAX_ATTEMPTS = 5
+
+
+def _validate_name_field(body: dict, field: str) -> dict | None:
+    """Validate a book name: a string within the length limit that isn't blank."""
+    error = validate_string_field(body, field, max_length=config.MAX_STRING_LENGTH)
+    if error:
+        return error
+    if not body[field].strip():
+        return error_response(400, "Bad Request", f'Field "{field}" cannot be empty')
+    return None
+
+
+# Validator per updatable field, called as validator(body, field); other fields are ignored
+_UPDATE_FIELD_VALIDATORS = {
+    "read": validate_boolean_field,
+    "author": functools.partial(validate_string_field, max_length=config.MAX_STRING_LENGTH),
+    "name": _validate_name_field,
+    "series_name": functools.partial(validate_string_field, max_length=config.MAX_STRING_LENGTH),
+    "series_order": validate_series_order,
+}
+
+# Presigned download URLs keyed by (bucket, key), reused across warm invocations
+_URL_CACHE = TTLCache(maxsize=config.URL_CACHE_MAX_ENTRIES)
+
+
+def _scan_segment(scan: Callable[..., dict], segment: int, total_segments: int) -> list[dict]:
+    """
+    Scan one segment of the Books table, following pagination within the segment.
+
+    Args:
+        scan: Low-level DynamoDB client scan method (resolved by the caller's thread)
+        segment: Zero-based segment number
+        total_segments: Total number of segments the table is split into
+
+    Returns:
+        list: All items in the segment
+    """
+    items: list[dict] = []
+    scan_kwargs: dict[str, Any] = {
+        "TableName": config.BOOKS_TABLE_NAME,
+        "Segment": segment,
+        "TotalSegments": total_segments,
+        "ProjectionExpression": LIST_PROJECTION_EXPRESSION,
+        "ExpressionAttributeNames": LIST_PROJECTION_NAMES,
+    }
+    while True:
+        # Low-level client: skips the Resource layer's per-attribute type marshalling
+        response = scan(**scan_kwargs)
+        items.extend(
+            deserialize_item(raw_item, native_numbers=True)
+            for raw_item in response.get("Items", [])
+        )
+        if "LastEvaluatedKey" not in response:
+            return items
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def _iter_all_books() -> Iterator[dict]:
+    """
+    Scan the whole Books table using a parallel segmented scan.
+
+    Yields:
+        dict: Book items (unordered), segment by segment as each completes
+    """
+    total_segments = config.SCAN_TOTAL_SEGMENTS
+    # Resolve the lazily created client here, not concurrently in the workers
+    scan = config.dynamodb_client.scan
+    futures = [
+        config.executor.submit(_scan_segment, scan, segment, total_segments)
+        for segment in range(total_segments)
+    ]
+    for future in as_completed(futures):
+        yield from future.result()
+
+
+def _created_sort_key(item: dict) -> str:
+    """Sort key for newest-first ordering (books without a created date sort last)."""
+    return item.get("created") or ""
+
+
+def _query_books_by_created(
+    limit: int | None, start_key: dict | None
+) -> tuple[list[dict], dict | None]:
+    """
+    Query the created-date index for books, newest first.
+
+    Args:
+        limit: Maximum number of books to return (None for all books)
+        start_key: ExclusiveStartKey to resume from (None for the first page)
+
+    Returns:
+        tuple: (items, last_evaluated_key) - last_evaluated_key is None when
+               there are no more books (low-level attribute value format)
+    """
+    items: list[dict] = []
+    query_kwargs: dict[str, Any] = {
+        "TableName": config.BOOKS_TABLE_NAME,
+        "IndexName": config.BOOKS_CREATED_INDEX,
+        "KeyConditionExpression": "entity_type = :type",
+        "ExpressionAttributeValues": {":type": {"S": config.BOOK_ENTITY_TYPE}},
+        "ProjectionExpression": LIST_PROJECTION_EXPRESSION,
+        "ExpressionAttributeNames": LIST_PROJECTION_NAMES,
+        "ScanIndexForward": False,
+    }
+    if start_key:
+        query_kwargs["ExclusiveStartKey"] = start_key
+    while True:
+        if limit is not None:
+            query_kwargs["Limit"] = limit - len(items)
+        response = config.dynamodb_client.query(**query_kwargs)
+        items.extend(
+            deserialize_item(raw_item, native_numbers=True)
+            for raw_item in response.get("Items", [])
+        )
+        last_key = response.get("LastEvaluatedKey")
+        if not last_key or (limit is not None and len(items) >= limit):
+            return items, last_key
+        query_kwargs["ExclusiveStartKey"] = last_key
+
+
+def _presign_download(bucket: str, s3_key: str) -> str:
+    """
+    Presign a download URL, signing locally when credentials are available.
+
+    Args:
+        bucket: S3 bucket name
+        s3_key: S3 object key
+
+    Returns:
+        str: Presigned GET URL valid for URL_EXPIRY_SECONDS
+    """
+    credentials = config.get_signing_credentials()
+    if credentials is not None:
+        return presign_get_object(
+            credentials, config.AWS_REGION, bucket, s3_key, config.URL_EXPIRY_SECONDS
+        )
+    return config.s3_client.generate_presigned_url(
+        "get_object",
+        Params={"Bucket": bucket, "Key": s3_key},
+        ExpiresIn=config.URL_EXPIRY_SECONDS,
+    )
+
+
+def _cached_presign(bucket: str, s3_key: str) -> tuple[str, int]:
+    """
+    Get a presigned download URL, reusing a cached one while it has enough validity left.
+
+    Returning the same URL for repeated requests also lets browsers cache the download.
+
+    Args:
+        bucket: S3 bucket name
+        s3_key: S3 object key
+
+    Returns:
+        tuple: (presigned_url, seconds_until_expiry)
+    """
+    cached = _URL_CACHE.get((bucket, s3_key), min_remaining=config.URL_CACHE_MIN_REMAINING_SECONDS)
+    if cached:
+        url, expires_at = cached
+        return url, int(expires_at - time.time())
+
+    url = _presign_download(bucket, s3_key)
+    _URL_CACHE.set((bucket, s3_key), url, config.URL_EXPIRY_SECONDS)
+    return url, config.URL_EXPIRY_SECONDS
+
+
+def _store_presigned_url(book_id: str, url: str, expires_at: int) -> None:
+    """
+    Persist a download URL on the book item so other containers can reuse it.
+
+    The condition skips the write if the item is gone or already holds a URL
+    that lives longer, so concurrent containers don't overwrite each other.
+
+    Args:
+        book_id: Book identifier
+        url: Presigned GET URL
+        expires_at: URL expiry (epoch seconds)
+    """
+    try:
+        config.books_table.update_item(
+            Key={"id": book_id},
+            UpdateExpression="SET presigned_url = :url, presigned_expires = :expires",
+            ConditionExpression="attribute_exists(id) AND "
+            "(attribute_not_exists(presigned_expires) OR presigned_expires < :expires)",
+            ExpressionAttributeValues={":url": url, ":expires": expires_at},
+        )
+    except ClientError as e:
+        # Best effort - the URL is still returned, it just isn't shared
+        if e.response["Error"]["Code"] != "ConditionalCheckFailedException":  # type: ignore[typeddict-item]
+            logger.warning(f"Error storing presigned URL for {book_id}: {str(e)}")
+
+
+def _stored_presign(book_item: dict) -> tuple[str, int] | None:
+    """
+    Get the download URL stored on a book item if it still has enough validity left.
+
+    Args:
+        book_item: DynamoDB item (Books table)
+
+    Returns:
+        tuple: (presigned_url, seconds_until_expiry), or None if there is no usable URL
+    """
+    stored_url = book_item.get("presigned_url")
+    stored_remaining = float(book_item.get("presigned_expires") or 0) - time.time()
+    if stored_url and stored_remaining > config.URL_CACHE_MIN_REMAINING_SECONDS:
+        return str(stored_url), int(stored_remaining)
+    return None
+
+
+def _item_cached_presign(book_item: dict, bucket: str, s3_key: str) -> tuple[str, int]:
+    """
+    Get a download URL, preferring the one stored on the book item.
+
+    The stored URL is shared by every container, so repeated downloads get the
+    same URL (and browser cache hits) until it is within
+    URL_CACHE_MIN_REMAINING_SECONDS of expiring.
+
+    Args:
+        book_item: DynamoDB item (Books table)
+        bucket: S3 bucket name
+        s3_key: S3 object key
+
+    Returns:
+        tuple: (presigned_url, seconds_until_expiry)
+    """
+    stored = _stored_presign(book_item)
+    if stored:
+        return stored
+
+    url, expires_in = _cached_presign(bucket, s3_key)
+    if url != book_item.get("presigned_url"):
+        expires_at = int(time.time()) + expires_in
+        _store_presigned_url(book_item["id"], url, expires_at)
+        # Keep a cached copy of the item in step so it isn't stored again
+        book_item["presigned_url"] = url
+        book_item["presigned_expires"] = expires_at
+    return url, expires_in
+
+
+def _get_book_item(book_id: str) -> dict | None:
+    """
+    Get a book item for download.
+
+    Always read from the table: updates and deletes run in other functions, so an
+    in-memory copy here could not be invalidated and would serve deleted books.
+
+    Args:
+        book_id: Book identifier
+
+    Returns:
+        dict: Book item, or None if the book doesn't exist
+    """
+    response = config.books_table.get_item(
+        Key={"id": book_id},
+        ProjectionExpression=GET_PROJECTION_EXPRESSION,
+        ExpressionAttributeNames=LIST_PROJECTION_NAMES,
+    )
+    return response.get("Item")
+
+
+def _batch_get_items(table_name: str, keys: list[dict], **table_params: Any) -> list[dict]:
+    """
+    Fetch items by key with BatchGetItem, chunked to the per-request key limit.
+
+    Unprocessed keys (throttling) are retried with a short backoff.
+
+    Args:
+        table_name: DynamoDB table name
+        keys: Unique primary keys to fetch
+        **table_params: Extra per-table request parameters (e.g. ProjectionExpression)
+
+    Returns:
+        list: Items that exist (unordered)
+    """
+    items: list[dict] = []
+    for start in range(0, len(keys), config.BATCH_GET_MAX_KEYS):
+        request_items: dict[str, Any] = {
+            table_name: {"Keys": keys[start : start + config.BATCH_GET_MAX_KEYS], **table_params}
+        }
+        for attempt in range(BATCH_GET_MAX_ATTEMPTS):
+            response = config.dynamodb.batch_get_item(RequestItems=request_items)
+            items.extend(response.get("Responses", {}).get(table_name, []))
+            request_items = response.get("UnprocessedKeys") or {}
+            if not request_items:
+                break
+            time.sleep(0.05 * 2**attempt)
+        else:
+            raise RuntimeError("BatchGetItem left unprocessed keys after retries")
+    return items
+
+
+def _batch_get_books(book_ids: list[str]) -> list[dict]:
+    """
+    Fetch books by ID with BatchGetItem.
+
+    Args:
+        book_ids: Unique book identifiers
+
+    Returns:
+        list: Book items that exist (unordered)
+    """
+    return _batch_get_items(
+        config.BOOKS_TABLE_NAME,
+        [{"id": book_id} for book_id in book_ids],
+        ProjectionExpression=GET_PROJECTION_EXPRESSION,
+        ExpressionAttributeNames=LIST_PROJECTION_NAMES,
+    )
+
+
+def _batch_get_user_books(user_id: str, book_ids: list[str]) -> dict[str, bool]:
+    """
+    Get a user's read statuses for specific books with BatchGetItem.
+
+    Args:
+        user_id: Cognito user ID
+        book_ids: Unique book identifiers
+
+    Returns:
+        dict: Mapping of bookId -> read status (books without a record are omitted)
+    """
+    try:
+        items = _batch_get_items(
+            config.USER_BOOKS_TABLE_NAME,
+            [{"userId": user_id, "bookId": book_id} for book_id in book_ids],
+            ProjectionExpression="bookId, #r",
+            ExpressionAttributeNames={"#r": "read"},
+            ConsistentRead=True,
+        )
+    except Exception as e:
+        logger.warning(f"Error fetching user read status: {str(e)}")
+        # Continue without user read status
+        return {}
+    return {item["bookId"]: item.get("read", False) for item in items}
+
+
+def _presign_book_download(book_item: dict) -> tuple[str, int] | None:
+    """
+    Get a (cached) presigned download URL for a book item.
+
+    Prefers the URL stored on the item by get_book_handler. New URLs are not
+    written back, so a batch never costs one write per book.
+
+    Args:
+        book_item: DynamoDB book item
+
+    Returns:
+        tuple: (presigned_url, seconds_until_expiry), or None if the item has no S3 location
+    """
+    location = get_book_s3_location(book_item)
+    if not location:
+        return None
+    return _stored_presign(book_item) or _cached_presign(*location)
 
 
 def _get_user_read_statuses(user_id: str) -> dict[str, bool]:
@@ -59,9 +452,13 @@ def _get_user_read_statuses(user_id: str) -> dict[str, bool]:
     """
     user_read_status = {}
     try:
+        # Strongly consistent (base table, one small partition) so the list
+        # reflects read/unread toggles made just before; Books reads stay
+        # eventually consistent
         user_response = config.user_books_table.query(
             KeyConditionExpression="userId = :uid",
             ExpressionAttributeValues={":uid": user_id},
+            ConsistentRead=True,
         )
         for item in user_response.get("Items", []):
             user_read_status[item["bookId"]] = item.get("read", False)
@@ -83,14 +480,15 @@ def _get_user_read_status(user_id: str, book_id: str) -> bool:
         bool: Read status (defaults to False if not found or error)
     """
     try:
+        # Strongly consistent so a read/unread toggle is visible on the next fetch
         user_book_response = config.user_books_table.get_item(
-            Key={"userId": user_id, "bookId": book_id}
+            Key={"userId": user_id, "bookId": book_id}, ConsistentRead=True
         )
         if "Item" in user_book_response:
             return user_book_response["Item"].get("read", False)
-    except ClientError as e:
+    except ClientError:
         # Log error but continue - read status will default to False
-        logger.error(f"Error fetching UserBooks record: {str(e)}", exc_info=True)
+        logger.exception("Error fetching UserBooks record")
     return False
 
 
@@ -118,16 +516,48 @@ def _update_user_book_status(user_id: str, book_id: str, read: bool) -> None:
         # Continue to update book metadata even if user status fails
 
 
-def _update_book_metadata(book_id: str, metadata_fields: dict[str, Any]) -> dict:
+def _toggle_read_status(user_id: str, book_id: str, read: bool) -> dict:
+    """
+    Fast path for a PATCH body of only {"read": bool} - the dominant update request.
+
+    Writes the UserBooks status on the shared executor while the book is fetched,
+    skipping metadata validation and update expression building entirely.
+
+    Args:
+        user_id: Cognito user ID
+        book_id: Book identifier
+        read: Read status to set
+
+    Returns:
+        dict: API Gateway response with the book and its new read status
+    """
+    status_future = config.executor.submit(_update_user_book_status, user_id, book_id, read)
+    try:
+        response = config.books_table.get_item(Key={"id": book_id})
+    finally:
+        status_future.result()
+
+    if "Item" not in response:
+        return error_response(404, "Not Found", f'Book "{book_id}" not found')
+    return api_response(200, serialize_book_response(response["Item"], read))
+
+
+def _update_book_metadata(
+    book_id: str, metadata_fields: dict[str, Any], current_item: dict | None = None
+) -> dict:
     """
     Update book metadata in Books table.
 
+    When the current item is already known, only the updated attributes are
+    returned by DynamoDB and overlaid locally instead of returning the whole item.
+
     Args:
         book_id: Book identifier
-        metadata_fields: Dictionary of fields to update
+        metadata_fields: Dictionary of fields to update (None/empty values are removed)
+        current_item: Book item read before the update, if available
 
     Returns:
-        dict: Updated book item from DynamoDB
+        dict: Updated book item
 
     Raises:
         ClientError: If book not found or DynamoDB error
@@ -140,13 +570,22 @@ def _update_book_metadata(book_id: str, metadata_fields: dict[str, Any]) -> dict
         fields=metadata_fields,
         allow_remove=True,
         condition_expression="attribute_exists(id)",
-        return_values="ALL_NEW"
+        return_values="ALL_NEW" if current_item is None else "UPDATED_NEW",
     )
 
     response = config.books_table.update_item(**update_params)
 
     logger.info(f"Successfully updated book metadata: {book_id}")
-    return response["Attributes"]
+    if current_item is None:
+        return response["Attributes"]
+
+    updated_book = {
+        field: value
+        for field, value in current_item.items()
+        if field not in metadata_fields or metadata_fields[field] not in (None, "")
+    }
+    updated_book.update(response.get("Attributes", {}))
+    return updated_book
 
 
 def list_handler(event, context):
@@ -157,45 +596,61 @@ def list_handler(event, context):
     logger.info("list_handler invoked")
 
     try:
-        # Get user ID
-        user_id = get_user_id(event)
+        # Get user ID and admin status
+        user_id, user_is_admin = get_user_context(event)
         if not user_id:
-            return error_response(401, "Unauthorized", "User not authenticated")
-
-        # Check if user is admin
-        user_is_admin = is_admin(event)
+            return unauthorized_response()
 
-        # Scan the Books table
-        response = config.books_table.scan()
-        items = response.get("Items", [])
+        # Optional pagination (limit/cursor query string parameters)
+        limit, start_key, error = parse_pagination_params(
+            event, config.MAX_PAGE_SIZE, CREATED_INDEX_KEY_ATTRIBUTES
+        )
+        if error:
+            return error
+        if start_key is not None and not config.BOOKS_CREATED_INDEX:
+            # Scans are sorted in memory and can't be resumed (no cursor is ever issued)
+            return error_response(
+                400, "Bad Request", "cursor is not supported without the created-date index"
+            )
 
-        # Handle pagination if needed
-        while "LastEvaluatedKey" in response:
-            response = config.books_table.scan(ExclusiveStartKey=response["LastEvaluatedKey"])
-            items.extend(response.get("Items", []))
+        # Fetch the user's read statuses concurrently with the books - no data dependency
+        statuses_future = config.executor.submit(_get_user_read_statuses, user_id)
+
+        next_cursor = None
+        if config.BOOKS_CREATED_INDEX:
+            # Query the created-date index (already sorted most recent first)
+            items, last_key = _query_books_by_created(limit, start_key)
+            if last_key:
+                next_cursor = encode_cursor(last_key)
+        elif limit is not None:
+            # No index configured - scan the Books table and keep only the newest `limit`
+            # books (no cursor: a sorted scan can't be resumed)
+            items = heapq.nlargest(limit, _iter_all_books(), key=_created_sort_key)
+        else:
+            # No index configured - scan the Books table and sort by created date (most recent first)
+            items = sorted(_iter_all_books(), key=_created_sort_key, reverse=True)
 
         logger.info(f"Retrieved {len(items)} books from DynamoDB")
 
         # Get user-specific read status for all books
-        user_read_status = _get_user_read_statuses(user_id)
+        user_read_status = statuses_future.result()
 
         # Convert DynamoDB items to API response format
-        books = []
-        for item in items:
-            read_status = user_read_status.get(item.get("id"), False)
-            book = serialize_book_response(item, read_status)
-            books.append(book)
-
-        # Sort by created date (most recent first)
-        books.sort(key=lambda x: x.get("created", ""), reverse=True)
+        books = [
+            serialize_book_response(item, user_read_status.get(item.get("id"), False))
+            for item in items
+        ]
 
         # Add user info to response
         response_data = {"books": books, "isAdmin": user_is_admin}
+        if next_cursor:
+            response_data["nextCursor"] = next_cursor
 
-        return api_response(200, response_data)
+        # Unchanged lists (same books and read statuses) are answered with 304 Not Modified
+        return conditional_response(event, api_response(200, response_data))
 
     except Exception as e:
-        logger.error(f"Error listing books: {str(e)}", exc_info=True)
+        logger.exception("Error listing books")
         return error_response(500, "Failed to list books", str(e))
 
 
@@ -204,7 +659,7 @@ def get_book_handler(event, context):
     Lambda handler to generate a presigned URL for downloading a specific book.
     Looks up metadata from DynamoDB and generates presigned URL from S3.
     Expects book ID in path parameter 'id'.
-    Returns presigned URL valid for 1 hour along with book metadata.
+    Returns presigned URL valid for up to 1 hour (at least 15 minutes) along with book metadata.
     """
     logger.info("get_book_handler invoked")
 
@@ -217,56 +672,118 @@ def get_book_handler(event, context):
         # Get user ID for user-specific read status
         user_id = get_user_id(event)
         if not user_id:
-            return error_response(401, "Unauthorized", "User not authenticated")
+            return unauthorized_response()
 
         logger.info(f"Fetching book: {book_id} for user: {user_id}")
 
+        # Fetch the user-specific read status from UserBooks concurrently with the book
+        read_status_future = config.executor.submit(_get_user_read_status, user_id, book_id)
+
         # Look up book in DynamoDB
         try:
-            response = config.books_table.get_item(Key={"id": book_id})
-            if "Item" not in response:
+            book_item = _get_book_item(book_id)
+            if book_item is None:
                 logger.warning(f"Book not found: {book_id}")
                 return error_response(404, "Not Found", f'Book "{book_id}" not found')
 
-            book_item = response["Item"]
-
         except ClientError as e:
-            logger.error(f"DynamoDB error: {str(e)}", exc_info=True)
+            logger.exception("DynamoDB error")
             return error_response(500, "Database Error", str(e))
 
-        # Get user-specific read status from UserBooks table
-        read_status = _get_user_read_status(user_id, book_id)
-
-        # Get S3 URL from DynamoDB record
-        s3_url = book_item.get("s3_url")
-        if not s3_url:
+        # Get S3 bucket and key from DynamoDB record
+        location = get_book_s3_location(book_item)
+        if not location:
             logger.error(f"Book {book_id} missing S3 URL in DynamoDB")
             return error_response(500, "Invalid Data", "Book record missing S3 URL")
-
-        # Extract bucket and key from S3 URL
-        # Format: s3://bucket-name/path/to/object
-        parsed_url = urlparse(str(s3_url))  # type: ignore[arg-type]
-        bucket = parsed_url.netloc
-        s3_key = parsed_url.path.lstrip("/")
+        bucket, s3_key = location
 
         logger.info(f"Generating presigned download URL for: {book_id}")
 
-        # Generate presigned URL (valid for 1 hour)
-        presigned_url = config.s3_client.generate_presigned_url(
-            "get_object",
-            Params={"Bucket": bucket, "Key": s3_key},
-            ExpiresIn=config.URL_EXPIRY_SECONDS,
-        )
+        # Presigned URL valid for 1 hour (cached URLs have at least 15 minutes left)
+        presigned_url, expires_in = _item_cached_presign(book_item, bucket, s3_key)
 
         # Return book metadata with presigned URL and user-specific read status
-        book_response = serialize_book_response(book_item, read_status)
+        book_response = serialize_book_response(book_item, read_status_future.result())
         book_response["downloadUrl"] = presigned_url
-        book_response["expiresIn"] = config.URL_EXPIRY_SECONDS
+        # expiresIn counts down every second, so it is left out of the ETag; the tag
+        # changes when the URL rotates, the read flag flips or metadata is edited
+        etag_source = dict(book_response)
+        book_response["expiresIn"] = expires_in
+
+        # The body carries the caller's read flag and editable metadata, so clients must
+        # revalidate; while nothing changed they get a 304 and keep their copy
+        return conditional_response(
+            event,
+            api_response(200, book_response, headers={"Cache-Control": "private, no-cache"}),
+            etag_source=etag_source,
+        )
 
-        return api_response(200, book_response)
+    except Exception as e:
+        logger.exception("Error generating presigned URL")
+        return error_response(500, "Internal Server Error", str(e))
+
+
+def get_books_batch_handler(event, context):
+    """
+    Lambda handler to fetch several books with download URLs in one request.
+    Expects JSON body {"ids": [...]} with up to MAX_BATCH_BOOK_IDS book IDs.
+    Returns books in request order, plus the IDs that were not found.
+    """
+    logger.info("get_books_batch_handler invoked")
+
+    try:
+        user_id = get_user_id(event)
+        if not user_id:
+            return unauthorized_response()
+
+        body, error = parse_json_body(event)
+        if error:
+            return error
+
+        book_ids = body.get("ids")
+        if (
+            not isinstance(book_ids, list)
+            or not book_ids
+            or not all(isinstance(book_id, str) and book_id for book_id in book_ids)
+        ):
+            return error_response(
+                400, "Bad Request", 'Field "ids" must be a non-empty list of book IDs'
+            )
+        if len(book_ids) > config.MAX_BATCH_BOOK_IDS:
+            return error_response(
+                400,
+                "Bad Request",
+                f"At most {config.MAX_BATCH_BOOK_IDS} book IDs can be requested at once",
+            )
+
+        # BatchGetItem rejects duplicate keys
+        unique_ids = list(dict.fromkeys(book_ids))
+        logger.info(f"Fetching {len(unique_ids)} books for user: {user_id}")
+
+        # Read statuses are keyed by the same IDs, so fetch them alongside the books
+        statuses_future = config.executor.submit(_batch_get_user_books, user_id, unique_ids)
+
+        items_by_id = {item["id"]: item for item in _batch_get_books(unique_ids)}
+        found_items = [items_by_id[book_id] for book_id in unique_ids if book_id in items_by_id]
+
+        user_read_status = statuses_future.result()
+
+        # Presigning is local CPU work; spread it over the shared pool
+        downloads = config.executor.map(_presign_book_download, found_items)
+
+        books = []
+        for item, download in zip(found_items, downloads, strict=True):
+            book = serialize_book_response(item, user_read_status.get(item["id"], False))
+            if download:
+                book["downloadUrl"], book["expiresIn"] = download
+            books.append(book)
+
+        not_found = [book_id for book_id in unique_ids if book_id not in items_by_id]
+
+        return api_response(200, {"books": books, "notFound": not_found})
 
     except Exception as e:
-        logger.error(f"Error generating presigned URL: {str(e)}", exc_info=True)
+        logger.exception("Error fetching books batch")
         return error_response(500, "Internal Server Error", str(e))
 
 
@@ -284,7 +801,7 @@ def update_book_handler(event, context):
         # Get user ID
         user_id = get_user_id(event)
         if not user_id:
-            return error_response(401, "Unauthorized", "User not authenticated")
+            return unauthorized_response()
 
         # Get the book ID from path parameters
         book_id, error = get_path_param(event, "id")
@@ -298,31 +815,16 @@ def update_book_handler(event, context):
         if error:
             return error
 
-        # Validate fields
-        error = validate_boolean_field(body, "read")
-        if error:
-            return error
+        # Validate only the fields present in the body (one pass)
+        for field in body:
+            validator = _UPDATE_FIELD_VALIDATORS.get(field)
+            if validator:
+                error = validator(body, field)
+                if error:
+                    return error
 
-        error = validate_string_field(body, "author", max_length=500)
-        if error:
-            return error
-
-        error = validate_string_field(body, "name", max_length=500, required=False)
-        if error:
-            return error
-
-        error = validate_string_field(body, "series_name", max_length=500)
-        if error:
-            return error
-
-        # Additional validation for name (cannot be empty if provided)
-        if "name" in body and not body["name"].strip():
-            return error_response(400, "Bad Request", 'Field "name" cannot be empty')
-
-        # Validate series_order if provided
-        error = validate_series_order(body)
-        if error:
-            return error
+        if body.keys() == {"read"}:
+            return _toggle_read_status(user_id, book_id, body["read"])
 
         # Separate user-specific fields from book metadata fields
         user_specific_fields = {}
@@ -348,14 +850,13 @@ def update_book_handler(event, context):
 
         # Update user-specific read status if provided
         if user_specific_fields:
-            _update_user_book_status(
-                user_id, book_id, user_specific_fields.get("read", False)
-            )
+            _update_user_book_status(user_id, book_id, user_specific_fields.get("read", False))
 
         # Update book metadata if provided
         updated_book = None
         if book_metadata_fields:
             # Check if author is changing - if so, fetch new cover
+            current_book = None
             if "author" in book_metadata_fields:
                 try:
                     # Get current book to check existing author
@@ -367,13 +868,15 @@ def update_book_handler(event, context):
                         new_author = book_metadata_fields["author"]
 
                         # Update cover if author is changing
-                        update_cover_on_author_change(current_author, new_author, title, book_metadata_fields)
+                        update_cover_on_author_change(
+                            current_author, new_author, title, book_metadata_fields
+                        )
                 except ClientError as e:
                     logger.error(f"Error getting current book: {str(e)}")
                     # Continue with update anyway
 
             try:
-                updated_book = _update_book_metadata(book_id, book_metadata_fields)
+                updated_book = _update_book_metadata(book_id, book_metadata_fields, current_book)
             except ClientError as e:
                 if e.response["Error"]["Code"] == "ConditionalCheckFailedException":  # type: ignore[typeddict-item]
                     logger.warning(f"Book not found: {book_id}")
@@ -391,13 +894,11 @@ def update_book_handler(event, context):
                 raise
 
         # Return combined response
-        read_status = (
-            user_specific_fields.get("read", False) if user_specific_fields else False
-        )
+        read_status = user_specific_fields.get("read", False) if user_specific_fields else False
         book_response = serialize_book_response(updated_book, read_status)
 
         return api_response(200, book_response)
 
     except Exception as e:
-        logger.error(f"Error updating book: {str(e)}", exc_info=True)
+        logger.exception("Error updating book")
         return error_response(500, "Internal Server Error", str(e))
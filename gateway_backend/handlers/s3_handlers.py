@@ -6,6 +6,7 @@ These handlers process S3 upload events and set book metadata after upload.
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 from datetime import UTC, datetime
@@ -17,22 +18,65 @@ from botocore.exceptions import ClientError
 try:
     # Lambda deployment
     import config
-    from utils.auth import is_admin
-    from utils.cover import fetch_cover_url as _fetch_cover_url_util, update_cover_on_author_change
+    from utils.auth import get_claims, is_admin_from_claims
+    from utils.cover import fetch_cover_url as _fetch_cover_url_util
+    from utils.cover import update_cover_on_author_change
     from utils.dynamodb import build_update_params
     from utils.response import api_response, error_response
     from utils.validation import parse_json_body, validate_series_order, validate_string_field
 except ImportError:
     # Local development
     import gateway_backend.config as config
-    from gateway_backend.utils.auth import is_admin
-    from gateway_backend.utils.cover import fetch_cover_url as _fetch_cover_url_util, update_cover_on_author_change
+    from gateway_backend.utils.auth import get_claims, is_admin_from_claims
+    from gateway_backend.utils.cover import fetch_cover_url as _fetch_cover_url_util
+    from gateway_backend.utils.cover import update_cover_on_author_change
     from gateway_backend.utils.dynamodb import build_update_params
     from gateway_backend.utils.response import api_response, error_response
-    from gateway_backend.utils.validation import parse_json_body, validate_series_order, validate_string_field
+    from gateway_backend.utils.validation import (
+        parse_json_body,
+        validate_series_order,
+        validate_string_field,
+    )
 
 logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+logger.setLevel(config.LOG_LEVEL)
+
+# Constant S3 trigger responses (never mutated)
+_S3_OK_RESPONSE = {
+    "statusCode": 200,
+    "body": json.dumps({"message": "Successfully processed S3 events"}),
+}
+_S3_NO_RECORDS_RESPONSE = {
+    "statusCode": 200,
+    "body": json.dumps({"message": "No records to process"}),
+}
+
+
+def _strip_or_none(value: str | None) -> str | None:
+    """Strip a validated string field, treating blank values as not provided."""
+    return (value or "").strip() or None
+
+
+def _int_or_none(value: int | str | None) -> int | None:
+    """Cast a validated series_order once (None means not provided)."""
+    return None if value is None else int(value)
+
+
+# Metadata accepted after upload: (field, validator(body, field), normalize(value));
+# fields that normalize to None are left untouched
+_METADATA_FIELDS = (
+    (
+        "author",
+        functools.partial(validate_string_field, max_length=config.MAX_STRING_LENGTH),
+        _strip_or_none,
+    ),
+    (
+        "series_name",
+        functools.partial(validate_string_field, max_length=config.MAX_STRING_LENGTH),
+        _strip_or_none,
+    ),
+    ("series_order", validate_series_order, _int_or_none),
+)
 
 
 def _parse_s3_event(record: dict) -> tuple[str | None, str | None, int]:
@@ -59,142 +103,187 @@ def _parse_s3_event(record: dict) -> tuple[str | None, str | None, int]:
     return bucket_name, s3_key, s3_size
 
 
-def _extract_book_metadata(filename: str) -> dict[str, str]:
+@functools.lru_cache(maxsize=1024)
+def _parse_filename(filename: str) -> tuple[str, str, str | None]:
     """
-    Extract metadata from filename.
+    Parse an uploaded filename into book ID, name and optional author.
 
-    Format: "Author Name - Book Title.zip" -> {"author": "Author Name", "name": "Book Title"}
-    Otherwise: "Book Title.zip" -> {"name": "Book Title"}
+    Format: "Author Name - Book Title.zip" -> ("Author Name - Book Title", "Book Title", "Author Name")
+    Otherwise: "Book Title.zip" -> ("Book Title", "Book Title", None)
+
+    Cached because S3 redelivers events for the same key.
 
     Args:
-        filename: Filename (without extension)
+        filename: Filename (last segment of the S3 key)
 
     Returns:
-        dict: Metadata extracted from filename
+        tuple: (book_id, name, author)
     """
-    metadata = {}
-
-    # Try to extract author from filename if it contains a dash
-    # Format: "Author Name - Book Title.zip"
-    if " - " in filename:
-        parts = filename.split(" - ", 1)
-        metadata["author"] = parts[0].strip()
-        metadata["name"] = parts[1].strip()
-    else:
-        metadata["name"] = filename
+    # ID keeps the original filename structure, minus .zip
+    book_id = filename.replace(".zip", "")
 
-    return metadata
+    # Split on the first " - " to extract an author
+    author, separator, title = book_id.partition(" - ")
+    if separator:
+        return book_id, title.strip(), author.strip()
+    return book_id, book_id, None
 
 
 # Alias the utility function for backward compatibility
 _fetch_cover_url = _fetch_cover_url_util
 
 
+def _build_book_item(bucket_name: str, s3_key: str, s3_size: int, timestamp: str) -> dict:
+    """
+    Build the Books table item for an uploaded S3 object.
+
+    Metadata comes from the filename, overridden by S3 object tags, plus a
+    cover image URL from Google Books when one is found.
+
+    Args:
+        bucket_name: S3 bucket name
+        s3_key: Decoded S3 object key
+        s3_size: Object size in bytes
+        timestamp: Creation timestamp (ISO 8601 UTC)
+
+    Returns:
+        dict: DynamoDB item for the book
+    """
+    # Parse ID, name and author (fallback if tags not present) from the filename
+    book_id, name, filename_author = _parse_filename(s3_key.rpartition("/")[2])
+
+    # Build S3 URL
+    s3_url = f"s3://{bucket_name}/{s3_key}"
+
+    # Create DynamoDB item
+    item = {
+        "id": book_id,
+        "entity_type": config.BOOK_ENTITY_TYPE,
+        "s3_url": s3_url,
+        "s3_bucket": bucket_name,
+        "s3_key": s3_key,
+        "name": name,
+        "created": timestamp,
+        "read": False,
+        "size": s3_size,
+    }
+    if filename_author:
+        item["author"] = filename_author
+
+    # Read S3 object tags for author, series_name, and series_order
+    try:
+        tagging_response = config.s3_client.get_object_tagging(Bucket=bucket_name, Key=s3_key)
+        tags = tagging_response.get("TagSet", [])
+
+        # Extract metadata from tags (override filename-based metadata)
+        for tag in tags:
+            tag_key = tag.get("Key")
+            tag_value = tag.get("Value")
+
+            if tag_key == "author" and tag_value:
+                item["author"] = tag_value
+                logger.info(f"Found author tag: {tag_value}")
+            elif tag_key == "series_name" and tag_value:
+                item["series_name"] = tag_value
+                logger.info(f"Found series_name tag: {tag_value}")
+            elif tag_key == "series_order" and tag_value:
+                try:
+                    item["series_order"] = int(tag_value)
+                    logger.info(f"Found series_order tag: {tag_value}")
+                except (ValueError, TypeError):
+                    logger.warning(f"Invalid series_order tag value: {tag_value}")
+
+    except ClientError as e:
+        logger.warning(f"Error reading S3 object tags: {str(e)}")
+        # Continue without tags - we already have filename-based metadata
+
+    # Fetch cover image URL from Google Books API
+    title = item.get("name", "")
+    author = item.get("author")
+    try:
+        cover_url = _fetch_cover_url(title, author)
+        if cover_url:
+            item["coverImageUrl"] = cover_url
+            logger.info(f"Found cover for '{title}': {cover_url[:60]}...")
+        else:
+            logger.info(f"No cover found for '{title}'")
+    except Exception as e:
+        logger.warning(f"Error fetching cover for '{title}': {str(e)}")
+        # Continue without cover URL
+
+    return item
+
+
+def _ingest_record(record: dict, timestamp: str) -> None:
+    """
+    Create the DynamoDB record for one S3 event record.
+
+    DynamoDB errors are logged so other records in the event still get processed.
+
+    Args:
+        record: S3 event record
+        timestamp: Creation timestamp shared by all records of the event
+    """
+    # Get S3 event details
+    bucket_name, s3_key, s3_size = _parse_s3_event(record)
+
+    if not bucket_name or not s3_key:
+        logger.warning(f"Invalid S3 event record: {record}")
+        return
+
+    item = _build_book_item(bucket_name, s3_key, s3_size, timestamp)
+
+    put_params: dict = {"Item": item}
+    # S3 may redeliver an event; the sequencer identifies the object version that
+    # triggered it, so only redeliveries are skipped. A re-upload has a new sequencer
+    # and replaces the whole item, including any metadata edited since the last upload
+    sequencer = record.get("s3", {}).get("object", {}).get("sequencer")
+    if sequencer:
+        item["s3_sequencer"] = sequencer
+        put_params["ConditionExpression"] = "attribute_not_exists(id) OR s3_sequencer <> :seq"
+        put_params["ExpressionAttributeValues"] = {":seq": sequencer}
+
+    # Put item in DynamoDB
+    try:
+        config.books_table.put_item(**put_params)
+        logger.info(f"Successfully added book to DynamoDB: {item['id']}")
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "ConditionalCheckFailedException":  # type: ignore[typeddict-item]
+            logger.info(f"Skipping duplicate S3 event for book: {item['id']}")
+            return
+        logger.error(f"Error adding book to DynamoDB: {str(e)}")
+        # Continue processing other records even if one fails
+
+
 def s3_trigger_handler(event, context):
     """
     Lambda handler triggered by S3 when a new file is uploaded to books/.
     Creates a DynamoDB record for the new book.
     Reads S3 object tags for author, series_name, and series_order metadata.
     """
+    records = event.get("Records")
+    if not records:
+        # Test notifications and empty events - nothing to ingest
+        return _S3_NO_RECORDS_RESPONSE
+
     try:
-        for record in event.get("Records", []):
-            # Get S3 event details
-            bucket_name, s3_key, s3_size = _parse_s3_event(record)
-
-            if not bucket_name or not s3_key:
-                logger.warning(f"Invalid S3 event record: {record}")
-                continue
-
-            # Extract filename from S3 key
-            filename = s3_key.split("/")[-1]
-
-            # Create a friendly name (remove .zip extension)
-            friendly_name = filename.replace(".zip", "")
-
-            # Generate unique ID (use filename without extension)
-            # For ID, keep original filename structure but URL-decode it
-            book_id = filename.replace(".zip", "")
-
-            # Build S3 URL
-            s3_url = f"s3://{bucket_name}/{s3_key}"
-
-            # Get timestamp (use timezone-aware UTC)
-            timestamp = datetime.now(UTC).isoformat().replace("+00:00", "Z")
-
-            # Create DynamoDB item
-            item = {
-                "id": book_id,
-                "s3_url": s3_url,
-                "name": friendly_name,
-                "created": timestamp,
-                "read": False,
-                "size": s3_size,
-            }
-
-            # Extract metadata from filename (fallback if tags not present)
-            metadata = _extract_book_metadata(friendly_name)
-            item.update(metadata)
-
-            # Read S3 object tags for author, series_name, and series_order
-            try:
-                tagging_response = config.s3_client.get_object_tagging(
-                    Bucket=bucket_name,
-                    Key=s3_key
-                )
-                tags = tagging_response.get("TagSet", [])
-
-                # Extract metadata from tags (override filename-based metadata)
-                for tag in tags:
-                    tag_key = tag.get("Key")
-                    tag_value = tag.get("Value")
-
-                    if tag_key == "author" and tag_value:
-                        item["author"] = tag_value
-                        logger.info(f"Found author tag: {tag_value}")
-                    elif tag_key == "series_name" and tag_value:
-                        item["series_name"] = tag_value
-                        logger.info(f"Found series_name tag: {tag_value}")
-                    elif tag_key == "series_order" and tag_value:
-                        try:
-                            item["series_order"] = int(tag_value)
-                            logger.info(f"Found series_order tag: {tag_value}")
-                        except (ValueError, TypeError):
-                            logger.warning(f"Invalid series_order tag value: {tag_value}")
-
-            except ClientError as e:
-                logger.warning(f"Error reading S3 object tags: {str(e)}")
-                # Continue without tags - we already have filename-based metadata
-
-            # Fetch cover image URL from Google Books API
-            title = item.get("name", "")
-            author = item.get("author")
-            try:
-                cover_url = _fetch_cover_url(title, author)
-                if cover_url:
-                    item["coverImageUrl"] = cover_url
-                    logger.info(f"Found cover for '{title}': {cover_url[:60]}...")
-                else:
-                    logger.info(f"No cover found for '{title}'")
-            except Exception as e:
-                logger.warning(f"Error fetching cover for '{title}': {str(e)}")
-                # Continue without cover URL
-
-            # Put item in DynamoDB
-            try:
-                config.books_table.put_item(Item=item)
-                logger.info(f"Successfully added book to DynamoDB: {book_id}")
-            except ClientError as e:
-                logger.error(f"Error adding book to DynamoDB: {str(e)}")
-                # Continue processing other records even if one fails
-                continue
+        # One timestamp per event (records of an event arrive within milliseconds)
+        # Fixed-width format: always includes microseconds so created dates sort lexically
+        timestamp = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+        if len(records) > 1:
+            # Records are independent - overlap their tag reads, cover lookups and writes
+            list(
+                config.executor.map(functools.partial(_ingest_record, timestamp=timestamp), records)
+            )
+        else:
+            for record in records:
+                _ingest_record(record, timestamp)
 
-        return {
-            "statusCode": 200,
-            "body": json.dumps({"message": "Successfully processed S3 events"}),
-        }
+        return _S3_OK_RESPONSE
 
     except Exception as e:
-        logger.error(f"Error processing S3 trigger: {str(e)}", exc_info=True)
+        logger.exception("Error processing S3 trigger")
         # For S3 triggers, we should return success even on error to prevent retries
         # Errors are logged to CloudWatch
         return {
@@ -220,16 +309,12 @@ def set_upload_metadata_handler(event, context):
     logger.info("set_upload_metadata_handler invoked")
 
     try:
-        # Check if user is admin
-        if not is_admin(event):
+        # Check if user is admin (claims are read once for the check and the email)
+        claims = get_claims(event)
+        if not is_admin_from_claims(claims):
             logger.warning("Non-admin user attempted to set upload metadata")
-            return error_response(
-                403, "Forbidden", "Only administrators can set upload metadata"
-            )
+            return error_response(403, "Forbidden", "Only administrators can set upload metadata")
 
-        # Verify user is authenticated
-        authorizer = event.get("requestContext", {}).get("authorizer", {})
-        claims = authorizer.get("claims", {})
         user_email = claims.get("email", "unknown")
 
         logger.info(f"Set metadata request from admin user: {user_email}")
@@ -245,31 +330,15 @@ def set_upload_metadata_handler(event, context):
             logger.warning("Missing bookId in request")
             return error_response(400, "Bad Request", "bookId is required")
 
-        # Validate optional fields
-        error = validate_string_field(body, "author", max_length=500)
-        if error:
-            return error
-
-        error = validate_string_field(body, "series_name", max_length=500)
-        if error:
-            return error
-
-        error = validate_series_order(body)
-        if error:
-            return error
-
-        author = body.get("author", "").strip()
-        series_name = body.get("series_name", "").strip()
-        series_order = body.get("series_order")
-
-        # Build metadata fields dictionary
+        # Validate and normalize the optional fields in one pass
         metadata_fields = {}
-        if author:
-            metadata_fields["author"] = author
-        if series_name:
-            metadata_fields["series_name"] = series_name
-        if series_order is not None:
-            metadata_fields["series_order"] = int(series_order)
+        for field, validator, normalize in _METADATA_FIELDS:
+            error = validator(body, field)
+            if error:
+                return error
+            value = normalize(body.get(field))
+            if value is not None:
+                metadata_fields[field] = value
 
         if not metadata_fields:
             # Nothing to update
@@ -282,29 +351,46 @@ def set_upload_metadata_handler(event, context):
             get_response = config.books_table.get_item(Key={"id": book_id})
             if "Item" not in get_response:
                 logger.warning(f"Book not found: {book_id}")
-                return error_response(
-                    404, "Not Found", f"Book with id {book_id} not found"
-                )
+                return error_response(404, "Not Found", f"Book with id {book_id} not found")
 
             current_book = get_response["Item"]
             current_author = current_book.get("author", "")
             title = current_book.get("name", book_id)
 
             # Update cover if author is changing
-            if author:
-                update_cover_on_author_change(current_author, author, title, metadata_fields)
+            if "author" in metadata_fields:
+                update_cover_on_author_change(
+                    current_author, metadata_fields["author"], title, metadata_fields
+                )
 
         except ClientError as e:
-            logger.error(f"Error getting current book: {str(e)}", exc_info=True)
+            logger.exception("Error getting current book")
             return error_response(500, "Database Error", str(e))
 
+        response_data = {
+            "message": "Metadata updated successfully",
+            "bookId": book_id,
+        }
+        response_data.update(metadata_fields)
+
+        # Only write attributes that differ from the stored record - resubmitting the
+        # same metadata costs no write at all
+        changed_fields = {
+            field: value
+            for field, value in metadata_fields.items()
+            if current_book.get(field) != value
+        }
+        if not changed_fields:
+            logger.info(f"Metadata unchanged for book: {book_id}, skipping update")
+            return api_response(200, response_data)
+
         # Update DynamoDB item
         update_params = build_update_params(
             key={"id": book_id},
-            fields=metadata_fields,
+            fields=changed_fields,
             allow_remove=True,
             condition_expression="attribute_exists(id)",
-            return_values="NONE"
+            return_values="NONE",
         )
 
         try:
@@ -312,22 +398,14 @@ def set_upload_metadata_handler(event, context):
 
             logger.info(f"Successfully updated metadata for book: {book_id}")
 
-            response_data = {
-                "message": "Metadata updated successfully",
-                "bookId": book_id,
-            }
-            response_data.update(metadata_fields)
-
             return api_response(200, response_data)
 
         except ClientError as e:
             if e.response["Error"]["Code"] == "ConditionalCheckFailedException":  # type: ignore[typeddict-item]
                 logger.warning(f"Book not found: {book_id}")
-                return error_response(
-                    404, "Not Found", f"Book with id {book_id} not found"
-                )
+                return error_response(404, "Not Found", f"Book with id {book_id} not found")
             raise
 
     except Exception as e:
-        logger.error(f"Error setting upload metadata: {str(e)}", exc_info=True)
+        logger.exception("Error setting upload metadata")
         return error_response(500, "Internal Server Error", str(e))
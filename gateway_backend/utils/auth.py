@@ -5,6 +5,30 @@ Provides functions to extract user identity and permissions from
 AWS Cognito authorizer context in API Gateway events.
 """
 
+ADMIN_GROUP = "admins"
+
+
+def get_claims(event: dict) -> dict:
+    """
+    Extract the Cognito claims from the authorizer context.
+
+    Args:
+        event: API Gateway event with Cognito authorization
+
+    Returns:
+        dict: Token claims (empty if the request was not authorized)
+    """
+    return event.get("requestContext", {}).get("authorizer", {}).get("claims") or {}
+
+
+def _claims_groups(claims: dict) -> list[str]:
+    """Split the comma-separated cognito:groups claim into group names."""
+    groups_str = claims.get("cognito:groups", "")
+    if not groups_str:
+        return []
+    # Groups come as comma-separated string
+    return [g.strip() for g in groups_str.split(",") if g.strip()]
+
 
 def get_user_id(event: dict) -> str | None:
     """
@@ -16,9 +40,7 @@ def get_user_id(event: dict) -> str | None:
     Returns:
         str: The user's Cognito sub (unique identifier), or None if not authenticated
     """
-    authorizer = event.get("requestContext", {}).get("authorizer", {})
-    claims = authorizer.get("claims", {})
-    return claims.get("sub")
+    return get_claims(event).get("sub")
 
 
 def get_user_groups(event: dict) -> list[str]:
@@ -31,13 +53,7 @@ def get_user_groups(event: dict) -> list[str]:
     Returns:
         list: List of group names the user belongs to (e.g., ['admins'])
     """
-    authorizer = event.get("requestContext", {}).get("authorizer", {})
-    claims = authorizer.get("claims", {})
-    groups_str = claims.get("cognito:groups", "")
-    if not groups_str:
-        return []
-    # Groups come as comma-separated string
-    return [g.strip() for g in groups_str.split(",") if g.strip()]
+    return _claims_groups(get_claims(event))
 
 
 def is_admin(event: dict) -> bool:
@@ -50,4 +66,31 @@ def is_admin(event: dict) -> bool:
     Returns:
         bool: True if user is in admins group, False otherwise
     """
-    return "admins" in get_user_groups(event)
+    return is_admin_from_claims(get_claims(event))
+
+
+def is_admin_from_claims(claims: dict) -> bool:
+    """
+    Check if already-extracted claims belong to a member of the admins group.
+
+    Args:
+        claims: Token claims from get_claims
+
+    Returns:
+        bool: True if user is in admins group, False otherwise
+    """
+    return ADMIN_GROUP in _claims_groups(claims)
+
+
+def get_user_context(event: dict) -> tuple[str | None, bool]:
+    """
+    Extract the user ID and admin flag with a single walk of the authorizer context.
+
+    Args:
+        event: API Gateway event with Cognito authorization
+
+    Returns:
+        tuple: (user_id, is_admin) - user_id is None if not authenticated
+    """
+    claims = get_claims(event)
+    return claims.get("sub"), is_admin_from_claims(claims)
@@ -0,0 +1,91 @@
+"""
+In-memory caching utilities for Books API
+
+Caches live at module level, so entries survive across warm Lambda invocations
+of the same container and are discarded with it.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class TTLCache:
+    """
+    Size-bounded LRU cache whose entries expire at an absolute time.
+
+    Safe to share between the threads of the shared executor: every access to
+    the underlying OrderedDict happens under a lock.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """
+        Args:
+            maxsize: Maximum number of entries before the least recently used is evicted
+        """
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, min_remaining: float = 0) -> tuple[Any, float] | None:
+        """
+        Get an entry that is still valid for at least `min_remaining` seconds.
+
+        Args:
+            key: Cache key
+            min_remaining: Required remaining lifetime in seconds
+
+        Returns:
+            tuple: (value, expires_at) or None if missing or too close to expiry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] - time.time() <= min_remaining:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> float:
+        """
+        Store a value for `ttl` seconds, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Lifetime in seconds
+
+        Returns:
+            float: Absolute expiry time (epoch seconds)
+        """
+        expires_at = time.time() + ttl
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return expires_at
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Remove an entry if present.
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
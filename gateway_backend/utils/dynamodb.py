@@ -6,7 +6,31 @@ Provides functions for building DynamoDB update expressions and queries.
 
 from __future__ import annotations
 
-from typing import Any, Dict
+import base64
+import binascii
+import functools
+import json
+from collections.abc import Collection
+from decimal import Decimal
+from typing import Any
+
+from boto3.dynamodb.types import TypeDeserializer
+
+_type_deserializer = TypeDeserializer()
+
+
+@functools.lru_cache(maxsize=64)
+def _field_placeholders(field: str) -> tuple[str, str, str]:
+    """
+    Get the expression fragments for a field (the set of updatable fields is small and fixed).
+
+    Args:
+        field: Attribute name
+
+    Returns:
+        tuple: (name_placeholder, value_placeholder, set_clause)
+    """
+    return f"#{field}", f":{field}", f"#{field} = :{field}"
 
 
 def build_update_expression(
@@ -36,8 +60,7 @@ def build_update_expression(
 
     for field, value in fields.items():
         # Use attribute name placeholders to avoid reserved word conflicts
-        name_placeholder = f"#{field}"
-        value_placeholder = f":{field}"
+        name_placeholder, value_placeholder, set_clause = _field_placeholders(field)
 
         expr_attr_names[name_placeholder] = field
 
@@ -46,7 +69,7 @@ def build_update_expression(
             remove_expr_parts.append(name_placeholder)
         else:
             # Set the attribute value
-            update_expr_parts.append(f"{name_placeholder} = {value_placeholder}")
+            update_expr_parts.append(set_clause)
             expr_attr_values[value_placeholder] = value
 
     # Build the full update expression
@@ -62,12 +85,12 @@ def build_update_expression(
 
 
 def build_update_params(
-    key: Dict[str, Any],
-    fields: Dict[str, Any],
+    key: dict[str, Any],
+    fields: dict[str, Any],
     allow_remove: bool = False,
     condition_expression: str | None = None,
-    return_values: str = "ALL_NEW"
-) -> Dict[str, Any]:
+    return_values: str = "ALL_NEW",
+) -> dict[str, Any]:
     """
     Build complete DynamoDB update_item parameters.
 
@@ -113,3 +136,87 @@ def build_update_params(
         params["ConditionExpression"] = condition_expression
 
     return params
+
+
+def encode_cursor(last_evaluated_key: dict[str, Any]) -> str:
+    """
+    Encode a DynamoDB LastEvaluatedKey as an opaque pagination cursor.
+
+    Args:
+        last_evaluated_key: LastEvaluatedKey from a query response (string attributes only)
+
+    Returns:
+        str: URL-safe base64 cursor
+    """
+    raw = json.dumps(last_evaluated_key, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str, key_attributes: Collection[str]) -> dict[str, Any]:
+    """
+    Decode a pagination cursor back into a DynamoDB ExclusiveStartKey.
+
+    The decoded key must have exactly the expected string attributes, so a
+    tampered cursor is rejected here instead of failing the query.
+
+    Args:
+        cursor: Cursor previously returned by encode_cursor
+        key_attributes: Attribute names of the key (table and index keys)
+
+    Returns:
+        dict: ExclusiveStartKey for the next query
+
+    Raises:
+        ValueError: If the cursor is malformed or isn't a key of the expected shape
+    """
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(key, dict) or key.keys() != set(key_attributes):
+        raise ValueError("Invalid cursor")
+    for value in key.values():
+        if not isinstance(value, dict) or value.keys() != {"S"} or not isinstance(value["S"], str):
+            raise ValueError("Invalid cursor")
+    return key
+
+
+def _parse_number(value: str) -> int | float:
+    """Parse a DynamoDB number string to int, or float if it has a fraction or exponent."""
+    if "." in value or "e" in value or "E" in value:
+        return float(value)
+    return int(value)
+
+
+def deserialize_item(
+    raw_item: dict[str, dict[str, Any]], native_numbers: bool = False
+) -> dict[str, Any]:
+    """
+    Convert a low-level DynamoDB item ({"attr": {"S": "value"}}) to Python values.
+
+    Scalar string, number, boolean and null attributes are converted inline;
+    other types fall back to boto3's TypeDeserializer. By default produces the
+    same values as the Resource API (numbers become Decimal).
+
+    Args:
+        raw_item: Item as returned by the low-level client
+        native_numbers: Convert top-level numbers to int/float instead of Decimal
+            (for read-only paths whose numbers are integers like size and series_order)
+
+    Returns:
+        dict: Item with native Python values
+    """
+    parse_number = _parse_number if native_numbers else Decimal
+    item: dict[str, Any] = {}
+    for name, typed_value in raw_item.items():
+        if "S" in typed_value:
+            item[name] = typed_value["S"]
+        elif "N" in typed_value:
+            item[name] = parse_number(typed_value["N"])
+        elif "BOOL" in typed_value:
+            item[name] = typed_value["BOOL"]
+        elif "NULL" in typed_value:
+            item[name] = None
+        else:
+            item[name] = _type_deserializer.deserialize(typed_value)
+    return item
@@ -6,34 +6,105 @@ Provides functions to create standardized API Gateway responses.
 
 from __future__ import annotations
 
+import hashlib
 import json
 from decimal import Decimal
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib if the package was built without orjson
+    orjson = None  # type: ignore[assignment]
 
-def api_response(status_code: int, body: Any) -> dict:
+# CORS headers shared by every response (never mutate - the same dict is reused)
+RESPONSE_HEADERS = {
+    "Content-Type": "application/json",
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Headers": "Content-Type,Authorization",
+    "Access-Control-Allow-Methods": "GET, POST, PATCH, DELETE, OPTIONS",
+}
+
+
+def _json_default(value: Any) -> Any:
+    """
+    Serialize types the JSON encoder doesn't handle natively (DynamoDB Decimals).
+
+    Args:
+        value: Value the encoder could not serialize
+
+    Returns:
+        int or float equivalent of a Decimal
+
+    Raises:
+        TypeError: If the value is not a Decimal
+    """
+    if isinstance(value, Decimal):
+        return convert_decimal(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps(body: Any) -> str:
+    """
+    Serialize a response body to compact JSON (orjson when available).
+
+    Args:
+        body: Response body
+
+    Returns:
+        str: JSON text
+    """
+    if orjson is not None:
+        return orjson.dumps(body, default=_json_default).decode()
+    return json.dumps(body, default=_json_default, separators=(",", ":"), ensure_ascii=False)
+
+
+def api_response(status_code: int, body: Any, headers: dict[str, str] | None = None) -> dict:
     """
     Helper to format API Gateway response with CORS headers.
 
     Args:
         status_code: HTTP status code
-        body: Response body (will be JSON serialized)
+        body: Response body (will be JSON serialized; Decimals are converted)
+        headers: Extra headers merged over the shared CORS headers (e.g. Cache-Control)
 
     Returns:
         dict: API Gateway response with headers
     """
     return {
         "statusCode": status_code,
-        "body": json.dumps(body),
-        "headers": {
-            "Content-Type": "application/json",
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Headers": "Content-Type,Authorization",
-            "Access-Control-Allow-Methods": "GET, POST, PATCH, DELETE, OPTIONS",
-        },
+        "body": _dumps(body),
+        "headers": {**RESPONSE_HEADERS, **headers} if headers else RESPONSE_HEADERS,
     }
 
 
+def conditional_response(event: dict, response: dict, etag_source: Any = None) -> dict:
+    """
+    Tag a response with an ETag of its body, answering 304 if the client already has it.
+
+    Args:
+        event: API Gateway event (for the If-None-Match request header)
+        response: Response built by api_response
+        etag_source: Value to tag instead of the body, for bodies with fields that change
+            on every request without the resource changing (e.g. a countdown)
+
+    Returns:
+        dict: The response with an ETag header, or an empty 304 Not Modified response
+    """
+    tagged = response["body"] if etag_source is None else _dumps(etag_source)
+    digest = hashlib.blake2b(tagged.encode(), digest_size=16).hexdigest()
+    etag = f'"{digest}"'
+    headers = {**response["headers"], "ETag": etag}
+
+    request_headers = event.get("headers") or {}
+    if_none_match = request_headers.get("If-None-Match") or request_headers.get("if-none-match")
+    if if_none_match and etag in {
+        tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+    }:
+        return {"statusCode": 304, "body": "", "headers": headers}
+
+    return {**response, "headers": headers}
+
+
 def error_response(status_code: int, error: str, message: str) -> dict:
     """
     Helper to create error response.
@@ -49,6 +120,31 @@ def error_response(status_code: int, error: str, message: str) -> dict:
     return api_response(status_code, {"error": error, "message": message})
 
 
+# Bodies of the most common failures, serialized once (str is immutable, so sharing is safe)
+_UNAUTHORIZED_BODY = _dumps({"error": "Unauthorized", "message": "User not authenticated"})
+_INVALID_JSON_BODY = _dumps({"error": "Bad Request", "message": "Invalid JSON in request body"})
+
+
+def unauthorized_response() -> dict:
+    """
+    Build the 401 response for a request without an authenticated user.
+
+    Returns:
+        dict: A fresh API Gateway response (callers may modify it)
+    """
+    return {"statusCode": 401, "body": _UNAUTHORIZED_BODY, "headers": dict(RESPONSE_HEADERS)}
+
+
+def invalid_json_response() -> dict:
+    """
+    Build the 400 response for a request body that is not valid JSON.
+
+    Returns:
+        dict: A fresh API Gateway response (callers may modify it)
+    """
+    return {"statusCode": 400, "body": _INVALID_JSON_BODY, "headers": dict(RESPONSE_HEADERS)}
+
+
 def convert_decimal(value: Any) -> Any:
     """
     Convert Decimal types (from DynamoDB) to int or float for JSON serialization.
@@ -0,0 +1,329 @@
+"""
+S3 utilities for Books API
+
+Provides helpers for locating book objects in S3 and presigning downloads and uploads.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import hmac
+import re
+from datetime import UTC, datetime
+from typing import Any
+from urllib.parse import quote
+
+import urllib3
+
+# Buckets that can be addressed as <bucket>.s3.<region>.amazonaws.com over HTTPS
+_VIRTUAL_HOST_BUCKET = re.compile(r"^[a-z0-9][a-z0-9-]{1,61}[a-z0-9]$")
+
+_SIGV4_ALGORITHM = "AWS4-HMAC-SHA256"
+_UNSIGNED_PAYLOAD = "UNSIGNED-PAYLOAD"
+
+# Short lifetime for URLs that are signed and used immediately by this container
+_DIRECT_REQUEST_EXPIRY_SECONDS = 60
+
+# Keep-alive connection pool shared across warm invocations (urllib3 ships with botocore);
+# same connect/read timeouts as config.CLIENT_CONFIG so a stalled S3 call fails fast
+_S3_HTTP = urllib3.PoolManager(
+    num_pools=1,
+    maxsize=10,
+    block=False,
+    retries=False,
+    timeout=urllib3.Timeout(connect=1, read=3),
+)
+
+
+def split_s3_uri(s3_url: str) -> tuple[str, str] | None:
+    """
+    Split an s3://bucket/key URL into its bucket and key.
+
+    Args:
+        s3_url: S3 URL (format: s3://bucket/key)
+
+    Returns:
+        tuple: (bucket, key), or None if the URL is not in that form
+    """
+    if not s3_url.startswith("s3://"):
+        return None
+    bucket, separator, s3_key = s3_url[5:].partition("/")
+    if not bucket or not separator:
+        return None
+    return bucket, s3_key
+
+
+def get_book_s3_location(book_item: dict) -> tuple[str, str] | None:
+    """
+    Get the S3 bucket and key for a book item.
+
+    Uses the s3_bucket/s3_key attributes written by the S3 trigger, falling back
+    to parsing s3_url for items ingested before those attributes existed.
+
+    Args:
+        book_item: DynamoDB item (Books table)
+
+    Returns:
+        tuple: (bucket, key), or None if the item has no S3 location
+    """
+    bucket = book_item.get("s3_bucket")
+    s3_key = book_item.get("s3_key")
+    if bucket and s3_key:
+        return str(bucket), str(s3_key)
+
+    # Legacy items: s3://bucket-name/path/to/object (remove once backfilled)
+    s3_url = book_item.get("s3_url")
+    if not s3_url:
+        return None
+    return split_s3_uri(str(s3_url))
+
+
+def _hmac_sha256(key: bytes, message: str) -> bytes:
+    return hmac.new(key, message.encode(), hashlib.sha256).digest()
+
+
+def _uri_encode(value: str) -> str:
+    return quote(value, safe="-_.~")
+
+
+@functools.lru_cache(maxsize=32)
+def _bucket_endpoint(region: str, bucket: str) -> tuple[str, str]:
+    """
+    Get the host and URI path prefix for a bucket (invariant per container).
+
+    Args:
+        region: Bucket region
+        bucket: S3 bucket name
+
+    Returns:
+        tuple: (host, path_prefix) - virtual-hosted when the bucket name allows it over HTTPS
+    """
+    if _VIRTUAL_HOST_BUCKET.match(bucket):
+        return f"{bucket}.s3.{region}.amazonaws.com", "/"
+    return f"s3.{region}.amazonaws.com", f"/{bucket}/"
+
+
+class PresignedUrlSigner:
+    """
+    SigV4 query-string presigner for S3 object URLs.
+
+    Builds URLs with string formatting and a handful of HMAC-SHA256 calls instead
+    of going through botocore's request/auth stack. The derived signing key only
+    depends on the secret key and UTC date, so it is cached until either changes.
+    """
+
+    def __init__(self, region: str) -> None:
+        """
+        Args:
+            region: Region of the buckets being signed for
+        """
+        self.region = region
+        # (secret_key, date_stamp, signing_key)
+        self._signing_key: tuple[str, str, bytes] | None = None
+
+    def _get_signing_key(self, secret_key: str, date_stamp: str) -> bytes:
+        """
+        Get the SigV4 signing key for the given secret and date (YYYYMMDD).
+
+        Args:
+            secret_key: AWS secret access key
+            date_stamp: UTC date of the request
+
+        Returns:
+            bytes: Derived signing key
+        """
+        cached = self._signing_key
+        if cached and cached[0] == secret_key and cached[1] == date_stamp:
+            return cached[2]
+
+        signing_key = _hmac_sha256(f"AWS4{secret_key}".encode(), date_stamp)
+        for scope_part in (self.region, "s3", "aws4_request"):
+            signing_key = _hmac_sha256(signing_key, scope_part)
+        self._signing_key = (secret_key, date_stamp, signing_key)
+        return signing_key
+
+    def presign(
+        self,
+        credentials: Any,
+        method: str,
+        bucket: str,
+        s3_key: str,
+        expires_in: int,
+        headers: dict[str, str] | None = None,
+        now: datetime | None = None,
+    ) -> str:
+        """
+        Presign an S3 object URL.
+
+        Headers passed here are signed, so the client must send them unchanged
+        with the request (e.g. Content-Type and x-amz-tagging for uploads).
+
+        Args:
+            credentials: Frozen credentials (access_key, secret_key, token)
+            method: HTTP method (GET, PUT)
+            bucket: S3 bucket name
+            s3_key: S3 object key
+            expires_in: URL lifetime in seconds
+            headers: Additional headers to sign
+            now: Signing time (defaults to the current UTC time)
+
+        Returns:
+            str: Presigned URL
+        """
+        now = now or datetime.now(UTC)
+        amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+        date_stamp = amz_date[:8]
+
+        host, path_prefix = _bucket_endpoint(self.region, bucket)
+        canonical_uri = path_prefix + quote(s3_key, safe="/~")
+
+        signed = {"host": host}
+        for name, value in (headers or {}).items():
+            signed[name.lower()] = " ".join(value.split())
+        signed_names = sorted(signed)
+        signed_headers = ";".join(signed_names)
+
+        scope = f"{date_stamp}/{self.region}/s3/aws4_request"
+        query = {
+            "X-Amz-Algorithm": _SIGV4_ALGORITHM,
+            "X-Amz-Credential": f"{credentials.access_key}/{scope}",
+            "X-Amz-Date": amz_date,
+            "X-Amz-Expires": str(expires_in),
+            "X-Amz-SignedHeaders": signed_headers,
+        }
+        if credentials.token:
+            query["X-Amz-Security-Token"] = credentials.token
+        canonical_query = "&".join(
+            f"{_uri_encode(name)}={_uri_encode(value)}" for name, value in sorted(query.items())
+        )
+
+        canonical_request = "\n".join(
+            (
+                method,
+                canonical_uri,
+                canonical_query,
+                "".join(f"{name}:{signed[name]}\n" for name in signed_names),
+                signed_headers,
+                _UNSIGNED_PAYLOAD,
+            )
+        )
+        string_to_sign = "\n".join(
+            (
+                _SIGV4_ALGORITHM,
+                amz_date,
+                scope,
+                hashlib.sha256(canonical_request.encode()).hexdigest(),
+            )
+        )
+        signature = hmac.new(
+            self._get_signing_key(credentials.secret_key, date_stamp),
+            string_to_sign.encode(),
+            hashlib.sha256,
+        ).hexdigest()
+
+        return f"https://{host}{canonical_uri}?{canonical_query}&X-Amz-Signature={signature}"
+
+
+@functools.cache
+def get_signer(region: str) -> PresignedUrlSigner:
+    """
+    Get the shared signer for a region (created once per container).
+
+    Args:
+        region: Bucket region
+
+    Returns:
+        PresignedUrlSigner: Signer whose signing key cache survives warm invocations
+    """
+    return PresignedUrlSigner(region)
+
+
+def presign_get_object(
+    credentials: Any, region: str, bucket: str, s3_key: str, expires_in: int
+) -> str:
+    """
+    Presign an S3 GET URL locally with SigV4 query authentication.
+
+    Equivalent to s3_client.generate_presigned_url("get_object", ...) without
+    the client's parameter validation, event hooks and request objects.
+
+    Args:
+        credentials: botocore Credentials (frozen per call)
+        region: Bucket region
+        bucket: S3 bucket name
+        s3_key: S3 object key
+        expires_in: URL lifetime in seconds
+
+    Returns:
+        str: Presigned URL
+    """
+    return get_signer(region).presign(
+        credentials.get_frozen_credentials(), "GET", bucket, s3_key, expires_in
+    )
+
+
+def presign_put_object(
+    credentials: Any,
+    region: str,
+    bucket: str,
+    s3_key: str,
+    expires_in: int,
+    content_type: str,
+    tagging: str | None = None,
+) -> str:
+    """
+    Presign an S3 PUT URL locally with SigV4 query authentication.
+
+    The uploader must send the same Content-Type (and x-amz-tagging, if given)
+    headers, matching s3_client.generate_presigned_url("put_object", ...).
+
+    Args:
+        credentials: botocore Credentials (frozen per call)
+        region: Bucket region
+        bucket: S3 bucket name
+        s3_key: S3 object key
+        expires_in: URL lifetime in seconds
+        content_type: Content-Type the upload will be sent with
+        tagging: URL-encoded S3 object tags (x-amz-tagging header)
+
+    Returns:
+        str: Presigned URL
+    """
+    headers = {"content-type": content_type}
+    if tagging:
+        headers["x-amz-tagging"] = tagging
+    return get_signer(region).presign(
+        credentials.get_frozen_credentials(), "PUT", bucket, s3_key, expires_in, headers=headers
+    )
+
+
+def delete_object(credentials: Any, region: str, bucket: str, s3_key: str) -> int:
+    """
+    Delete an S3 object with a locally signed request over the pooled connection.
+
+    Equivalent to s3_client.delete_object(...) without botocore's endpoint
+    resolution, serializers and event hooks.
+
+    Args:
+        credentials: botocore Credentials (frozen per call)
+        region: Bucket region
+        bucket: S3 bucket name
+        s3_key: S3 object key
+
+    Returns:
+        int: HTTP status returned by S3 (204 on success)
+
+    Raises:
+        urllib3.exceptions.HTTPError: If the request could not be sent or timed out
+            (callers convert it to a ClientError like the boto client would raise)
+    """
+    url = get_signer(region).presign(
+        credentials.get_frozen_credentials(),
+        "DELETE",
+        bucket,
+        s3_key,
+        _DIRECT_REQUEST_EXPIRY_SECONDS,
+    )
+    response = _S3_HTTP.request("DELETE", url, preload_content=True)
+    return response.status
@@ -6,11 +6,15 @@ Provides functions to validate and extract data from API Gateway events.
 
 from __future__ import annotations
 
-import json
 import logging
-from typing import Any
+from collections.abc import Collection
 from urllib.parse import unquote
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # Fall back to the stdlib if the package was built without orjson
+    from json import loads as _json_loads
+
 logger = logging.getLogger()
 
 
@@ -30,16 +34,64 @@ def get_path_param(event: dict, param: str) -> tuple[str | None, dict | None]:
     path_params = event.get("pathParameters", {})
     if not path_params or param not in path_params:
         logger.warning(f"Missing {param} in path parameters")
-        return None, error_response(
-            400, "Bad Request", f"{param.capitalize()} is required in path"
-        )
+        return None, error_response(400, "Bad Request", f"{param.capitalize()} is required in path")
     return unquote(path_params[param]), None
 
 
+def parse_pagination_params(
+    event: dict, max_limit: int, cursor_key_attributes: Collection[str]
+) -> tuple[int | None, dict | None, dict | None]:
+    """
+    Extract optional `limit` and `cursor` query string parameters.
+
+    Args:
+        event: API Gateway event
+        max_limit: Largest allowed page size
+        cursor_key_attributes: Attribute names a valid cursor key must have
+
+    Returns:
+        tuple: (limit, exclusive_start_key, error_response) - limit and
+               exclusive_start_key are None when not provided
+    """
+    from .dynamodb import decode_cursor
+    from .response import error_response
+
+    query_params = event.get("queryStringParameters") or {}
+
+    limit = None
+    if "limit" in query_params:
+        try:
+            limit = int(query_params["limit"])
+        except (ValueError, TypeError):
+            limit = 0
+        if limit < 1 or limit > max_limit:
+            logger.warning(f"Invalid limit: {query_params['limit']}")
+            return (
+                None,
+                None,
+                error_response(
+                    400, "Bad Request", f"limit must be an integer between 1 and {max_limit}"
+                ),
+            )
+
+    start_key = None
+    if query_params.get("cursor"):
+        try:
+            start_key = decode_cursor(query_params["cursor"], cursor_key_attributes)
+        except ValueError:
+            logger.warning("Invalid pagination cursor")
+            return None, None, error_response(400, "Bad Request", "Invalid cursor")
+
+    return limit, start_key, None
+
+
 def parse_json_body(event: dict) -> tuple[dict, dict | None]:
     """
     Parse JSON body from API Gateway event.
 
+    Every endpoint takes a JSON object, so other JSON values (lists, strings,
+    numbers) are rejected here rather than failing later in the handler.
+
     Args:
         event: API Gateway event
 
@@ -47,13 +99,18 @@ def parse_json_body(event: dict) -> tuple[dict, dict | None]:
         tuple: (parsed_body, error_response) - If successful, error_response is None
                If error, parsed_body is empty dict (caller should check error first)
     """
-    from .response import error_response
+    from .response import error_response, invalid_json_response
 
     try:
-        return json.loads(event.get("body", "{}")), None
-    except json.JSONDecodeError:
+        body = _json_loads(event.get("body") or "{}")
+    except ValueError:  # JSONDecodeError from either parser
         logger.warning("Invalid JSON in request body")
-        return {}, error_response(400, "Bad Request", "Invalid JSON in request body")
+        return {}, invalid_json_response()
+
+    if not isinstance(body, dict):
+        logger.warning(f"Request body is not a JSON object: {type(body).__name__}")
+        return {}, error_response(400, "Bad Request", "Request body must be a JSON object")
+    return body, None
 
 
 def validate_string_field(
@@ -130,6 +187,7 @@ def validate_series_order(body: dict, field: str = "series_order") -> dict | Non
         from utils.response import error_response
     except ImportError:
         from gateway_backend.config import MAX_SERIES_ORDER, MIN_SERIES_ORDER
+
         from .response import error_response
 
     if field not in body:
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Backfill the entity_type attribute on existing books in DynamoDB.
+
+Books are listed via the ByCreated GSI (hash key: entity_type, range key:
+created). Items written before the index existed have no entity_type and
+are invisible to it until this script is run. Books written by the S3
+trigger and by migrate-books.py already carry entity_type, so this is only
+needed once for items created before the index was added.
+
+This script:
+1. Scans all books in the Books table
+2. For each book without entity_type, sets entity_type = "book"
+
+Usage:
+    python3 scripts/backfill-entity-type.py
+
+Environment variables:
+    AWS_REGION: AWS region (default: us-east-2)
+    DYNAMODB_TABLE: DynamoDB table name (default: Books)
+"""
+
+import os
+import sys
+
+import boto3
+
+# Configuration
+REGION = os.environ.get("AWS_REGION", "us-east-2")
+TABLE_NAME = os.environ.get("DYNAMODB_TABLE", "Books")
+ENTITY_TYPE = "book"
+
+
+def main():
+    """Main backfill logic."""
+    print("=" * 60)
+    print("📚 Book entity_type Backfill Script")
+    print("=" * 60)
+    print(f"Region: {REGION}")
+    print(f"Table: {TABLE_NAME}")
+    print()
+
+    # Initialize DynamoDB
+    dynamodb = boto3.resource("dynamodb", region_name=REGION)
+    table = dynamodb.Table(TABLE_NAME)
+
+    # Scan all books (only the attributes we need)
+    print("🔍 Scanning DynamoDB for books...")
+    scan_kwargs = {
+        "ProjectionExpression": "id, entity_type, created",
+    }
+    response = table.scan(**scan_kwargs)
+    items = response.get("Items", [])
+
+    # Handle pagination
+    while "LastEvaluatedKey" in response:
+        response = table.scan(ExclusiveStartKey=response["LastEvaluatedKey"], **scan_kwargs)
+        items.extend(response.get("Items", []))
+
+    print(f"📊 Found {len(items)} total books")
+    print()
+
+    stats = {"total": len(items), "already_set": 0, "updated": 0, "missing_created": 0, "errors": 0}
+
+    for i, item in enumerate(items, 1):
+        book_id = item.get("id", "unknown")
+
+        if item.get("entity_type") == ENTITY_TYPE:
+            stats["already_set"] += 1
+            continue
+
+        print(f"[{i}/{len(items)}] Updating: {book_id}")
+
+        # Items without a created date still get entity_type but won't appear in the index
+        if not item.get("created"):
+            print("  ⚠️  No created date - book will not appear in the ByCreated index")
+            stats["missing_created"] += 1
+
+        try:
+            table.update_item(
+                Key={"id": book_id},
+                UpdateExpression="SET entity_type = :type",
+                ExpressionAttributeValues={":type": ENTITY_TYPE},
+                ConditionExpression="attribute_exists(id)",
+            )
+            stats["updated"] += 1
+        except Exception as e:
+            print(f"  ❌ Failed to update DynamoDB: {str(e)}")
+            stats["errors"] += 1
+
+    # Print summary
+    print()
+    print("=" * 60)
+    print("📊 Backfill Summary:")
+    print("=" * 60)
+    print(f"Total books:           {stats['total']}")
+    print(f"Already set:           {stats['already_set']}")
+    print(f"Updated:               {stats['updated']}")
+    print(f"Missing created date:  {stats['missing_created']}")
+    print(f"Errors:                {stats['errors']}")
+    print("=" * 60)
+
+    return 0 if stats["errors"] == 0 else 1
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        print("\n⚠️  Interrupted by user")
+        sys.exit(130)
+    except Exception as e:
+        print(f"\n❌ Fatal error: {str(e)}")
+        import traceback
+
+        traceback.print_exc()
+        sys.exit(1)
@@ -32,6 +32,8 @@ REGION = os.environ.get('AWS_REGION', 'us-east-2')
 BUCKET = os.environ.get('S3_BUCKET', 'YOUR_BUCKET')
 PREFIX = os.environ.get('BOOKS_PREFIX', 'books/')
 TABLE_NAME = os.environ.get('DYNAMODB_TABLE', 'Books')
+# Partition key value of the ByCreated index used to list books (matches config.BOOK_ENTITY_TYPE)
+ENTITY_TYPE = 'book'
 
 def main():
     # Initialize AWS clients
@@ -88,7 +90,10 @@ def main():
             # Build item
             item = {
                 'id': book_id,
+                'entity_type': ENTITY_TYPE,
                 's3_url': f"s3://{BUCKET}/{key}",
+                's3_bucket': BUCKET,
+                's3_key': key,
                 'name': friendly_name,
                 'created': obj['LastModified'].isoformat(),
                 'read': False,
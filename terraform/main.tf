@@ -143,6 +143,16 @@ resource "aws_dynamodb_table" "books" {
     type = "S"
   }
 
+  attribute {
+    name = "entity_type"
+    type = "S"
+  }
+
+  attribute {
+    name = "created"
+    type = "S"
+  }
+
   # GSI for querying by author
   global_secondary_index {
     name            = "AuthorIndex"
@@ -151,6 +161,14 @@ resource "aws_dynamodb_table" "books" {
     projection_type = "ALL"
   }
 
+  # GSI for listing books by created date (entity_type is always "book")
+  global_secondary_index {
+    name            = "ByCreated"
+    hash_key        = "entity_type"
+    range_key       = "created"
+    projection_type = "ALL"
+  }
+
   point_in_time_recovery {
     enabled = var.enable_point_in_time_recovery
   }
@@ -179,6 +197,13 @@ resource "aws_dynamodb_table" "user_books" {
     type = "S"
   }
 
+  # GSI for finding every user's entry for a book (book deletion cleanup)
+  global_secondary_index {
+    name            = "ByBookId"
+    hash_key        = "bookId"
+    projection_type = "KEYS_ONLY"
+  }
+
   point_in_time_recovery {
     enabled = var.enable_point_in_time_recovery
   }
@@ -368,6 +393,7 @@ resource "aws_iam_role_policy" "lambda_dynamodb" {
           aws_dynamodb_table.books.arn,
           "${aws_dynamodb_table.books.arn}/index/*",
           aws_dynamodb_table.user_books.arn,
+          "${aws_dynamodb_table.user_books.arn}/index/*",
           aws_dynamodb_table.authors.arn
         ]
       }
@@ -0,0 +1,29 @@
+"""
+Shared pytest fixtures for backend unit tests.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def clear_handler_caches():
+    """Reset module-level caches so cached values never leak between tests"""
+    from gateway_backend.handlers import book_handlers
+
+    book_handlers._URL_CACHE.clear()
+    yield
+    book_handlers._URL_CACHE.clear()
+
+
+@pytest.fixture(autouse=True)
+def presign_with_client():
+    """Route presigning through s3_client so tests can patch generate_presigned_url
+
+    Tests of the local signer patch get_signing_credentials themselves.
+    """
+    from gateway_backend import config
+
+    with patch.object(config, "get_signing_credentials", return_value=None):
+        yield
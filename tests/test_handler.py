@@ -1,8 +1,12 @@
 import json
+import re
 from decimal import Decimal
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
+
+from boto3.dynamodb.types import TypeSerializer
 
 from gateway_backend import config, handler
+from gateway_backend.utils.dynamodb import encode_cursor
 
 
 def create_mock_event(user_id="test-user-123", is_admin=False, path_params=None, body=None):
@@ -40,6 +44,48 @@ def create_mock_event(user_id="test-user-123", is_admin=False, path_params=None,
     return event
 
 
+def raw_page(page):
+    """Convert a Resource-style scan/query response to the low-level client format
+
+    Args:
+        page: Response with plain Python Items (and optional LastEvaluatedKey)
+
+    Returns:
+        dict: Response with DynamoDB-typed attribute values
+    """
+    serializer = TypeSerializer()
+
+    def to_raw(item):
+        return {name: serializer.serialize(value) for name, value in item.items()}
+
+    raw = {"Items": [to_raw(item) for item in page.get("Items", [])]}
+    if "LastEvaluatedKey" in page:
+        raw["LastEvaluatedKey"] = to_raw(page["LastEvaluatedKey"])
+    return raw
+
+
+def segmented_scan(*pages):
+    """Create a scan side_effect that serves pages from segment 0 only
+
+    list_handler scans the Books table in parallel segments with the low-level
+    client; a plain return_value would be repeated for every segment.
+
+    Args:
+        pages: Resource-style scan responses returned in order for segment 0
+
+    Returns:
+        callable: side_effect for a mocked dynamodb_client.scan
+    """
+    remaining = iter(pages)
+
+    def scan(**kwargs):
+        if kwargs.get("Segment", 0) != 0:
+            return {"Items": []}
+        return raw_page(next(remaining))
+
+    return scan
+
+
 def test_list_handler_returns_books_list():
     """Test that handler returns list of books from DynamoDB"""
 
@@ -67,8 +113,8 @@ def test_list_handler_returns_books_list():
     }
 
     # Create mock DynamoDB tables
-    mock_books_table = Mock()
-    mock_books_table.scan.return_value = mock_dynamodb_response
+    mock_dynamodb_client = Mock()
+    mock_dynamodb_client.scan.side_effect = segmented_scan(mock_dynamodb_response)
 
     # Mock UserBooks table - user has read book-b
     mock_user_books_table = Mock()
@@ -82,7 +128,7 @@ def test_list_handler_returns_books_list():
     event = create_mock_event(user_id="test-user-123", is_admin=False)
 
     # Patch both tables
-    with patch.object(config, "books_table", mock_books_table), \
+    with patch.object(config, "dynamodb_client", mock_dynamodb_client), \
          patch.object(config, "user_books_table", mock_user_books_table):
         resp = handler.list_handler(event, None)
 
@@ -116,15 +162,15 @@ def test_list_handler_empty_table():
     """Test handler when DynamoDB table is empty"""
 
     # Mock empty DynamoDB response
-    mock_books_table = Mock()
-    mock_books_table.scan.return_value = {"Items": []}
+    mock_dynamodb_client = Mock()
+    mock_dynamodb_client.scan.return_value = {"Items": []}
     
     mock_user_books_table = Mock()
     mock_user_books_table.scan.return_value = {"Items": []}
 
     event = create_mock_event()
 
-    with patch.object(config, "books_table", mock_books_table), \
+    with patch.object(config, "dynamodb_client", mock_dynamodb_client), \
          patch.object(config, "user_books_table", mock_user_books_table):
         resp = handler.list_handler(event, None)
 
@@ -165,15 +211,15 @@ def test_list_handler_pagination():
         ]
     }
 
-    mock_books_table = Mock()
-    mock_books_table.scan.side_effect = [mock_response_page1, mock_response_page2]
+    mock_dynamodb_client = Mock()
+    mock_dynamodb_client.scan.side_effect = segmented_scan(mock_response_page1, mock_response_page2)
     
     mock_user_books_table = Mock()
     mock_user_books_table.scan.return_value = {"Items": []}
 
     event = create_mock_event()
 
-    with patch.object(config, "books_table", mock_books_table), \
+    with patch.object(config, "dynamodb_client", mock_dynamodb_client), \
          patch.object(config, "user_books_table", mock_user_books_table):
         resp = handler.list_handler(event, None)
 
@@ -181,19 +227,285 @@ def test_list_handler_pagination():
     body = json.loads(resp["body"])
     assert len(body["books"]) == 2
 
+    # Second page of segment 0 continues from the first page's LastEvaluatedKey
+    segment_zero_calls = [
+        c.kwargs for c in mock_dynamodb_client.scan.call_args_list if c.kwargs["Segment"] == 0
+    ]
+    assert len(segment_zero_calls) == 2
+    assert segment_zero_calls[1]["ExclusiveStartKey"] == {"id": {"S": "book-1.zip"}}
+
+
+def test_list_handler_scans_all_segments():
+    """Test handler scans every segment of the Books table and merges the results"""
+
+    def scan(**kwargs):
+        segment = kwargs["Segment"]
+        return {
+            "Items": [
+                {
+                    "id": f"book-{segment}.zip",
+                    "name": f"Book {segment}.zip",
+                    "created": f"2023-01-{segment + 1:02d}T00:00:00Z",
+                    "s3_url": f"s3://test-bucket/books/Book {segment}.zip",
+                }
+            ]
+        }
+
+    mock_dynamodb_client = Mock()
+    mock_dynamodb_client.scan.side_effect = lambda **kwargs: raw_page(scan(**kwargs))
+
+    mock_user_books_table = Mock()
+    mock_user_books_table.query.return_value = {"Items": []}
+
+    event = create_mock_event()
+
+    with patch.object(config, "dynamodb_client", mock_dynamodb_client), \
+         patch.object(config, "user_books_table", mock_user_books_table):
+        resp = handler.list_handler(event, None)
+
+    assert resp["statusCode"] == 200
+    body = json.loads(resp["body"])
+    total_segments = config.SCAN_TOTAL_SEGMENTS
+    assert len(body["books"]) == total_segments
+
+    # Results from all segments are merged and sorted newest first
+    assert body["books"][0]["id"] == f"book-{total_segments - 1}.zip"
+    assert body["books"][-1]["id"] == "book-0.zip"
+    assert {c.kwargs["TotalSegments"] for c in mock_dynamodb_client.scan.call_args_list} == {total_segments}
+
+
+def test_list_handler_scan_limit_returns_newest_books():
+    """Test a limit without the created-date index keeps only the newest books"""
+
+    mock_dynamodb_client = Mock()
+    mock_dynamodb_client.scan.side_effect = segmented_scan({
+        "Items": [
+            {"id": "book-a", "name": "Book A", "created": "2023-01-01T00:00:00Z"},
+            {"id": "book-c", "name": "Book C", "created": "2023-03-01T00:00:00Z"},
+            {"id": "no-date", "name": "No Date"},
+            {"id": "book-b", "name": "Book B", "created": "2023-02-01T00:00:00Z"},
+        ]
+    })
+
+    mock_user_books_table = Mock()
+    mock_user_books_table.query.return_value = {"Items": []}
+
+    event = create_mock_event()
+    event["queryStringParameters"] = {"limit": "2"}
+
+    with patch.object(config, "dynamodb_client", mock_dynamodb_client), \
+         patch.object(config, "user_books_table", mock_user_books_table):
+        resp = handler.list_handler(event, None)
+
+    assert resp["statusCode"] == 200
+    body = json.loads(resp["body"])
+    assert [b["id"] for b in body["books"]] == ["book-c", "book-b"]
+    assert "nextCursor" not in body
+
+
+def test_list_handler_projects_only_serialized_fields():
+    """Test list reads only the attributes returned to the client"""
+
+    mock_dynamodb_client = Mock()
+    mock_dynamodb_client.scan.side_effect = segmented_scan(
+        {"Items": [], "LastEvaluatedKey": {"id": "book-1"}},
+        {"Items": []},
+    )
+
+    mock_user_books_table = Mock()
+    mock_user_books_table.query.return_value = {"Items": []}
+
+    event = create_mock_event()
+
+    with patch.object(config, "dynamodb_client", mock_dynamodb_client), \
+         patch.object(config, "user_books_table", mock_user_books_table):
+        resp = handler.list_handler(event, None)
+
+    assert resp["statusCode"] == 200
+    # Every call, including paginated follow-ups, carries the projection
+    for call in mock_dynamodb_client.scan.call_args_list:
+        projection = call.kwargs["ProjectionExpression"]
+        names = call.kwargs["ExpressionAttributeNames"]
+        fields = {names.get(f.strip(), f.strip()) for f in projection.split(",")}
+        assert {"id", "name", "created", "s3_url", "author", "size", "coverImageUrl"} <= fields
+
+
+def test_list_handler_queries_created_index():
+    """Test handler queries the created-date index when configured, keeping index order"""
+
+    mock_dynamodb_client = Mock()
+    mock_dynamodb_client.query.side_effect = [raw_page(page) for page in [
+        {
+            "Items": [
+                {"id": "book-c", "name": "Book C", "created": "2023-03-01T00:00:00Z", "s3_url": "s3://test-bucket/books/Book C.zip"},
+                {"id": "book-b", "name": "Book B", "created": "2023-02-01T00:00:00Z", "s3_url": "s3://test-bucket/books/Book B.zip"},
+            ],
+            "LastEvaluatedKey": {"id": "book-b", "entity_type": "book", "created": "2023-02-01T00:00:00Z"},
+        },
+        {
+            "Items": [
+                {"id": "book-a", "name": "Book A", "created": "2023-01-01T00:00:00Z", "s3_url": "s3://test-bucket/books/Book A.zip"},
+            ]
+        },
+    ]]
+
+    mock_user_books_table = Mock()
+    mock_user_books_table.query.return_value = {"Items": []}
+
+    event = create_mock_event()
+
+    with patch.object(config, "dynamodb_client", mock_dynamodb_client), \
+         patch.object(config, "user_books_table", mock_user_books_table), \
+         patch.object(config, "BOOKS_CREATED_INDEX", "ByCreated"):
+        resp = handler.list_handler(event, None)
+
+    assert resp["statusCode"] == 200
+    body = json.loads(resp["body"])
+    assert [b["id"] for b in body["books"]] == ["book-c", "book-b", "book-a"]
+    assert "nextCursor" not in body
+
+    # No scan, and all pages of the index are read newest first
+    mock_dynamodb_client.scan.assert_not_called()
+    first_call, second_call = mock_dynamodb_client.query.call_args_list
+    assert first_call.kwargs["IndexName"] == "ByCreated"
+    assert first_call.kwargs["ScanIndexForward"] is False
+    assert first_call.kwargs["ExpressionAttributeValues"] == {":type": {"S": "book"}}
+    assert "Limit" not in first_call.kwargs
+    assert second_call.kwargs["ExclusiveStartKey"]["id"] == {"S": "book-b"}
+
+
+def test_list_handler_fetches_read_status_concurrently():
+    """Test the UserBooks query runs while the Books index query is still in flight"""
+    import threading
+
+    user_books_queried = threading.Event()
+
+    def query_books(**kwargs):
+        # Only returns if the read-status query was started without waiting for this one
+        assert user_books_queried.wait(timeout=5)
+        return raw_page({"Items": [{"id": "book-a", "name": "Book A", "s3_url": "s3://test-bucket/books/Book A.zip"}]})
+
+    def query_user_books(**kwargs):
+        user_books_queried.set()
+        return {"Items": [{"userId": "test-user-123", "bookId": "book-a", "read": True}]}
+
+    mock_dynamodb_client = Mock()
+    mock_dynamodb_client.query.side_effect = query_books
+    mock_user_books_table = Mock()
+    mock_user_books_table.query.side_effect = query_user_books
+
+    event = create_mock_event()
+
+    with patch.object(config, "dynamodb_client", mock_dynamodb_client), \
+         patch.object(config, "user_books_table", mock_user_books_table), \
+         patch.object(config, "BOOKS_CREATED_INDEX", "ByCreated"):
+        resp = handler.list_handler(event, None)
+
+    assert resp["statusCode"] == 200
+    body = json.loads(resp["body"])
+    assert body["books"][0]["read"] is True
+
+
+def test_list_handler_limit_returns_cursor():
+    """Test handler returns a single page and a cursor that resumes the query"""
+
+    last_key = {"id": "book-b", "entity_type": "book", "created": "2023-02-01T00:00:00Z"}
+    mock_dynamodb_client = Mock()
+    mock_dynamodb_client.query.return_value = raw_page({
+        "Items": [
+            {"id": "book-c", "name": "Book C", "created": "2023-03-01T00:00:00Z", "s3_url": "s3://test-bucket/books/Book C.zip"},
+            {"id": "book-b", "name": "Book B", "created": "2023-02-01T00:00:00Z", "s3_url": "s3://test-bucket/books/Book B.zip"},
+        ],
+        "LastEvaluatedKey": last_key,
+    })
+
+    mock_user_books_table = Mock()
+    mock_user_books_table.query.return_value = {"Items": []}
+
+    event = create_mock_event()
+    event["queryStringParameters"] = {"limit": "2"}
+
+    with patch.object(config, "dynamodb_client", mock_dynamodb_client), \
+         patch.object(config, "user_books_table", mock_user_books_table), \
+         patch.object(config, "BOOKS_CREATED_INDEX", "ByCreated"):
+        resp = handler.list_handler(event, None)
+
+        assert resp["statusCode"] == 200
+        body = json.loads(resp["body"])
+        assert len(body["books"]) == 2
+        assert mock_dynamodb_client.query.call_count == 1
+        assert mock_dynamodb_client.query.call_args.kwargs["Limit"] == 2
+
+        # Passing the cursor back resumes from the last evaluated key
+        event["queryStringParameters"] = {"limit": "2", "cursor": body["nextCursor"]}
+        handler.list_handler(event, None)
+
+    assert mock_dynamodb_client.query.call_args.kwargs["ExclusiveStartKey"] == raw_page(
+        {"LastEvaluatedKey": last_key}
+    )["LastEvaluatedKey"]
+
+
+def test_list_handler_invalid_pagination_params():
+    """Test handler rejects invalid limit and cursor values"""
+
+    mock_dynamodb_client = Mock()
+
+    with patch.object(config, "dynamodb_client", mock_dynamodb_client), \
+         patch.object(config, "BOOKS_CREATED_INDEX", "ByCreated"):
+        for params in (
+            {"limit": "0"},
+            {"limit": "abc"},
+            {"limit": "1000"},
+            {"cursor": "not-a-cursor!"},
+            # Decodes cleanly but isn't a key of the created-date index
+            {"cursor": encode_cursor({"a": 1})},
+            {"cursor": encode_cursor({"id": {"S": "book-a"}})},
+            {
+                "cursor": encode_cursor(
+                    {"id": {"S": "book-a"}, "entity_type": {"S": "book"}, "created": {"N": "1"}}
+                )
+            },
+        ):
+            event = create_mock_event()
+            event["queryStringParameters"] = params
+            resp = handler.list_handler(event, None)
+            assert resp["statusCode"] == 400, params
+
+    mock_dynamodb_client.query.assert_not_called()
+
+
+def test_list_handler_rejects_cursor_without_index():
+    """Test a cursor is rejected instead of silently ignored when the list falls back to a scan"""
+    cursor = encode_cursor(
+        {"id": {"S": "book-b"}, "entity_type": {"S": "book"}, "created": {"S": "2023-02-01"}}
+    )
+    mock_dynamodb_client = Mock()
+
+    event = create_mock_event()
+    event["queryStringParameters"] = {"cursor": cursor}
+
+    with (
+        patch.object(config, "dynamodb_client", mock_dynamodb_client),
+        patch.object(config, "BOOKS_CREATED_INDEX", None),
+    ):
+        resp = handler.list_handler(event, None)
+
+    assert resp["statusCode"] == 400
+    mock_dynamodb_client.scan.assert_not_called()
+
 
 def test_list_handler_dynamodb_error():
     """Test handler when DynamoDB throws an error"""
 
-    mock_books_table = Mock()
-    mock_books_table.scan.side_effect = Exception("DynamoDB connection error")
+    mock_dynamodb_client = Mock()
+    mock_dynamodb_client.scan.side_effect = Exception("DynamoDB connection error")
     
     mock_user_books_table = Mock()
     mock_user_books_table.scan.return_value = {"Items": []}
 
     event = create_mock_event()
 
-    with patch.object(config, "books_table", mock_books_table), \
+    with patch.object(config, "dynamodb_client", mock_dynamodb_client), \
          patch.object(config, "user_books_table", mock_user_books_table):
         resp = handler.list_handler(event, None)
 
@@ -233,7 +545,7 @@ def test_get_book_handler_success():
 
     mock_books_table = Mock()
     mock_books_table.get_item.return_value = mock_books_item
-    
+
     mock_user_books_table = Mock()
     mock_user_books_table.get_item.return_value = mock_user_books_item
 
@@ -252,6 +564,406 @@ def test_get_book_handler_success():
     assert body["expiresIn"] == 3600
     assert body["read"] is True  # User-specific read status
     assert body["author"] == "Author A"
+    # Read status is read-your-writes after a PATCH
+    assert mock_user_books_table.get_item.call_args.kwargs["ConsistentRead"] is True
+
+
+def test_get_book_handler_reuses_cached_presigned_url():
+    """Test repeated downloads of a book return the same presigned URL without re-signing"""
+
+    event = create_mock_event(path_params={"id": "book-a"})
+
+    mock_books_table = Mock()
+    mock_books_table.get_item.return_value = {
+        "Item": {"id": "book-a", "name": "Book A", "s3_url": "s3://test-bucket/books/Book A.zip"}
+    }
+
+    mock_user_books_table = Mock()
+    mock_user_books_table.get_item.return_value = {}
+
+    with (
+        patch.object(config, "books_table", mock_books_table),
+        patch.object(config, "user_books_table", mock_user_books_table),
+        patch.object(config.s3_client, "generate_presigned_url", side_effect=["url-1", "url-2"]) as mock_generate,
+    ):
+        first = json.loads(handler.get_book_handler(event, None)["body"])
+        second = json.loads(handler.get_book_handler(event, None)["body"])
+
+    assert first["downloadUrl"] == second["downloadUrl"] == "url-1"
+    mock_generate.assert_called_once()
+    assert config.URL_CACHE_MIN_REMAINING_SECONDS < second["expiresIn"] <= 3600
+
+
+def test_get_book_handler_reads_book_on_every_request():
+    """Test a book deleted by another function is not served from a stale in-memory copy"""
+
+    event = create_mock_event(path_params={"id": "book-a"})
+
+    mock_books_table = Mock()
+    mock_books_table.get_item.side_effect = [
+        {"Item": {"id": "book-a", "name": "Book A", "s3_url": "s3://test-bucket/books/Book A.zip"}},
+        {},
+    ]
+
+    mock_user_books_table = Mock()
+    mock_user_books_table.get_item.return_value = {}
+
+    with (
+        patch.object(config, "books_table", mock_books_table),
+        patch.object(config, "user_books_table", mock_user_books_table),
+        patch.object(config.s3_client, "generate_presigned_url", return_value="url-1"),
+    ):
+        first = handler.get_book_handler(event, None)
+        second = handler.get_book_handler(event, None)
+
+    assert first["statusCode"] == 200
+    assert second["statusCode"] == 404
+    assert mock_books_table.get_item.call_count == 2
+
+
+def test_get_book_handler_reuses_url_stored_on_item():
+    """Test a presigned URL stored on the book item is returned without signing or writing"""
+    import time
+
+    event = create_mock_event(path_params={"id": "book-a"})
+
+    mock_books_table = Mock()
+    mock_books_table.get_item.return_value = {
+        "Item": {
+            "id": "book-a",
+            "name": "Book A",
+            "s3_url": "s3://test-bucket/books/Book A.zip",
+            "presigned_url": "stored-url",
+            "presigned_expires": int(time.time()) + 3000,
+        }
+    }
+
+    mock_user_books_table = Mock()
+    mock_user_books_table.get_item.return_value = {}
+
+    with (
+        patch.object(config, "books_table", mock_books_table),
+        patch.object(config, "user_books_table", mock_user_books_table),
+        patch.object(config.s3_client, "generate_presigned_url") as mock_generate,
+    ):
+        resp = handler.get_book_handler(event, None)
+
+    body = json.loads(resp["body"])
+    assert body["downloadUrl"] == "stored-url"
+    assert 2990 < body["expiresIn"] <= 3000
+    assert resp["headers"]["Cache-Control"] == "private, no-cache"
+    assert resp["headers"]["ETag"]
+    assert "presigned_url" not in body
+    mock_generate.assert_not_called()
+    projection = mock_books_table.get_item.call_args.kwargs["ProjectionExpression"]
+    assert "presigned_url" in projection and "presigned_expires" in projection
+    mock_books_table.update_item.assert_not_called()
+
+
+def test_get_book_handler_returns_304_for_matching_etag():
+    """Test a revalidation with the current ETag gets an empty 304 instead of the book"""
+    import time
+
+    item = {
+        "id": "book-a",
+        "name": "Book A",
+        "s3_url": "s3://test-bucket/books/Book A.zip",
+        "presigned_url": "stored-url",
+        "presigned_expires": int(time.time()) + 3000,
+    }
+    mock_books_table = Mock()
+    mock_books_table.get_item.return_value = {"Item": item}
+    mock_user_books_table = Mock()
+    mock_user_books_table.get_item.return_value = {}
+
+    with (
+        patch.object(config, "books_table", mock_books_table),
+        patch.object(config, "user_books_table", mock_user_books_table),
+    ):
+        first = handler.get_book_handler(create_mock_event(path_params={"id": "book-a"}), None)
+        event = create_mock_event(path_params={"id": "book-a"})
+        event["headers"] = {"If-None-Match": first["headers"]["ETag"]}
+        # A minute later expiresIn has counted down, but the book and URL are unchanged
+        later = time.time() + 60
+        with patch("time.time", return_value=later):
+            second = handler.get_book_handler(event, None)
+
+    assert first["statusCode"] == 200
+    assert second["statusCode"] == 304
+    assert second["body"] == ""
+    assert second["headers"]["ETag"] == first["headers"]["ETag"]
+
+
+def test_get_book_handler_etag_changes_with_read_status():
+    """Test flipping the caller's read flag changes the ETag so clients refetch"""
+    import time
+
+    item = {
+        "id": "book-a",
+        "name": "Book A",
+        "s3_url": "s3://test-bucket/books/Book A.zip",
+        "presigned_url": "stored-url",
+        "presigned_expires": int(time.time()) + 3000,
+    }
+    mock_books_table = Mock()
+    mock_books_table.get_item.return_value = {"Item": item}
+    mock_user_books_table = Mock()
+    mock_user_books_table.get_item.return_value = {}
+
+    with (
+        patch.object(config, "books_table", mock_books_table),
+        patch.object(config, "user_books_table", mock_user_books_table),
+    ):
+        first = handler.get_book_handler(create_mock_event(path_params={"id": "book-a"}), None)
+        mock_user_books_table.get_item.return_value = {"Item": {"read": True}}
+        event = create_mock_event(path_params={"id": "book-a"})
+        event["headers"] = {"If-None-Match": first["headers"]["ETag"]}
+        second = handler.get_book_handler(event, None)
+
+    assert second["statusCode"] == 200
+    assert json.loads(second["body"])["read"] is True
+    assert second["headers"]["ETag"] != first["headers"]["ETag"]
+
+
+def test_get_book_handler_stores_new_presigned_url_on_item():
+    """Test a freshly signed URL is stored on the item when the stored one is near expiry"""
+    import time
+
+    event = create_mock_event(path_params={"id": "book-a"})
+
+    mock_books_table = Mock()
+    mock_books_table.get_item.return_value = {
+        "Item": {
+            "id": "book-a",
+            "name": "Book A",
+            "s3_url": "s3://test-bucket/books/Book A.zip",
+            "presigned_url": "old-url",
+            "presigned_expires": int(time.time()) + 60,
+        }
+    }
+
+    mock_user_books_table = Mock()
+    mock_user_books_table.get_item.return_value = {}
+
+    with (
+        patch.object(config, "books_table", mock_books_table),
+        patch.object(config, "user_books_table", mock_user_books_table),
+        patch.object(config.s3_client, "generate_presigned_url", return_value="new-url"),
+    ):
+        resp = handler.get_book_handler(event, None)
+
+    assert json.loads(resp["body"])["downloadUrl"] == "new-url"
+    assert resp["headers"]["Cache-Control"] == "private, no-cache"
+    call_kwargs = mock_books_table.update_item.call_args.kwargs
+    assert call_kwargs["Key"] == {"id": "book-a"}
+    assert call_kwargs["ExpressionAttributeValues"][":url"] == "new-url"
+    assert "attribute_exists(id)" in call_kwargs["ConditionExpression"]
+
+
+def test_get_books_batch_handler_returns_books_in_request_order():
+    """Test batch handler fetches books in one BatchGetItem and presigns each"""
+
+    event = create_mock_event(body={"ids": ["book-b", "missing", "book-a", "book-b"]})
+
+    def batch_get_item(RequestItems):
+        if "UserBooks" in RequestItems:
+            return {"Responses": {"UserBooks": [{"bookId": "book-a", "read": True}]}}
+        return {
+            "Responses": {
+                "Books": [
+                    {"id": "book-a", "name": "Book A", "s3_url": "s3://test-bucket/books/Book A.zip"},
+                    {"id": "book-b", "name": "Book B", "s3_url": "s3://test-bucket/books/Book B.zip"},
+                ]
+            }
+        }
+
+    mock_dynamodb = Mock()
+    mock_dynamodb.batch_get_item.side_effect = batch_get_item
+
+    with (
+        patch.object(config, "dynamodb", mock_dynamodb),
+        patch.object(config, "BOOKS_TABLE_NAME", "Books"),
+        patch.object(config, "USER_BOOKS_TABLE_NAME", "UserBooks"),
+        patch.object(config.s3_client, "generate_presigned_url", side_effect=lambda op, Params, ExpiresIn: f"signed:{Params['Key']}"),
+    ):
+        resp = handler.get_books_batch_handler(event, None)
+
+    assert resp["statusCode"] == 200
+    body = json.loads(resp["body"])
+    assert [b["id"] for b in body["books"]] == ["book-b", "book-a"]
+    assert body["books"][0]["downloadUrl"] == "signed:books/Book B.zip"
+    assert body["books"][1]["read"] is True
+    assert body["notFound"] == ["missing"]
+
+    # Duplicate IDs are removed before one BatchGetItem call per table
+    assert mock_dynamodb.batch_get_item.call_count == 2
+    requests = {
+        table: params["Keys"]
+        for call in mock_dynamodb.batch_get_item.call_args_list
+        for table, params in call.kwargs["RequestItems"].items()
+    }
+    assert requests["Books"] == [{"id": "book-b"}, {"id": "missing"}, {"id": "book-a"}]
+    assert requests["UserBooks"] == [
+        {"userId": "test-user-123", "bookId": book_id} for book_id in ("book-b", "missing", "book-a")
+    ]
+
+
+def test_get_books_batch_handler_reuses_urls_stored_on_items():
+    """Test batch downloads reuse fresh stored URLs without signing or writing them back"""
+    import time
+
+    event = create_mock_event(body={"ids": ["book-a"]})
+    stored_expires = int(time.time()) + 3000
+
+    def batch_get_item(RequestItems):
+        if "UserBooks" in RequestItems:
+            return {"Responses": {"UserBooks": []}}
+        assert "presigned_url" in RequestItems["Books"]["ProjectionExpression"]
+        return {
+            "Responses": {
+                "Books": [
+                    {
+                        "id": "book-a",
+                        "s3_url": "s3://test-bucket/books/Book A.zip",
+                        "presigned_url": "stored-url",
+                        "presigned_expires": Decimal(stored_expires),
+                    }
+                ]
+            }
+        }
+
+    mock_dynamodb = Mock()
+    mock_dynamodb.batch_get_item.side_effect = batch_get_item
+    mock_books_table = Mock()
+    mock_presign = Mock()
+
+    with (
+        patch.object(config, "dynamodb", mock_dynamodb),
+        patch.object(config, "books_table", mock_books_table),
+        patch.object(config, "BOOKS_TABLE_NAME", "Books"),
+        patch.object(config, "USER_BOOKS_TABLE_NAME", "UserBooks"),
+        patch.object(config.s3_client, "generate_presigned_url", mock_presign),
+    ):
+        resp = handler.get_books_batch_handler(event, None)
+
+    assert resp["statusCode"] == 200
+    book = json.loads(resp["body"])["books"][0]
+    assert book["downloadUrl"] == "stored-url"
+    assert 2990 <= book["expiresIn"] <= 3000
+    assert "presigned_url" not in book
+    mock_presign.assert_not_called()
+    mock_books_table.update_item.assert_not_called()
+
+
+def test_get_books_batch_handler_chunks_and_retries_unprocessed_keys():
+    """Test IDs are split into 100-key requests and unprocessed keys are retried"""
+
+    book_ids = [f"book-{i}" for i in range(150)]
+    event = create_mock_event(body={"ids": book_ids})
+
+    def batch_get_item(RequestItems):
+        if "UserBooks" in RequestItems:
+            return {"Responses": {"UserBooks": []}}
+        keys = RequestItems["Books"]["Keys"]
+        if len(keys) == 100:
+            # Throttle the last key of the first chunk once
+            return {
+                "Responses": {"Books": [{"id": k["id"]} for k in keys[:-1]]},
+                "UnprocessedKeys": {"Books": {**RequestItems["Books"], "Keys": keys[-1:]}},
+            }
+        return {"Responses": {"Books": [{"id": k["id"]} for k in keys]}}
+
+    mock_dynamodb = Mock()
+    mock_dynamodb.batch_get_item.side_effect = batch_get_item
+
+    with (
+        patch.object(config, "dynamodb", mock_dynamodb),
+        patch.object(config, "BOOKS_TABLE_NAME", "Books"),
+        patch.object(config, "USER_BOOKS_TABLE_NAME", "UserBooks"),
+        patch("time.sleep"),
+    ):
+        resp = handler.get_books_batch_handler(event, None)
+
+    assert resp["statusCode"] == 200
+    body = json.loads(resp["body"])
+    assert len(body["books"]) == 150
+    assert body["notFound"] == []
+    # Items without an S3 URL get no download link
+    assert "downloadUrl" not in body["books"][0]
+    # Books: 100-key chunk, its retry, then the 50-key chunk; UserBooks: two chunks
+    assert mock_dynamodb.batch_get_item.call_count == 5
+
+
+def test_get_books_batch_handler_invalid_ids():
+    """Test batch handler validates the ids field"""
+
+    mock_dynamodb = Mock()
+
+    with patch.object(config, "dynamodb", mock_dynamodb):
+        for body in ({}, {"ids": []}, {"ids": "book-a"}, {"ids": [1]}, {"ids": ["x"] * 501}):
+            resp = handler.get_books_batch_handler(create_mock_event(body=body), None)
+            assert resp["statusCode"] == 400, body
+
+    mock_dynamodb.batch_get_item.assert_not_called()
+
+
+def test_get_book_handler_presigns_locally_with_credentials():
+    """Test download URLs are signed locally instead of through the S3 client"""
+    from botocore.credentials import Credentials
+
+    event = create_mock_event(path_params={"id": "book-a"})
+
+    mock_books_table = Mock()
+    mock_books_table.get_item.return_value = {
+        "Item": {"id": "book-a", "name": "Book A", "s3_bucket": "test-bucket", "s3_key": "books/Book A.zip"}
+    }
+
+    mock_user_books_table = Mock()
+    mock_user_books_table.get_item.return_value = {}
+
+    with (
+        patch.object(config, "books_table", mock_books_table),
+        patch.object(config, "user_books_table", mock_user_books_table),
+        patch.object(config, "get_signing_credentials", return_value=Credentials("AKIDEXAMPLE", "secret")),
+        patch.object(config.s3_client, "generate_presigned_url") as mock_generate,
+    ):
+        resp = handler.get_book_handler(event, None)
+
+    assert resp["statusCode"] == 200
+    body = json.loads(resp["body"])
+    assert body["downloadUrl"].startswith("https://test-bucket.s3.us-east-2.amazonaws.com/books/Book%20A.zip?")
+    assert "X-Amz-Signature=" in body["downloadUrl"]
+    mock_generate.assert_not_called()
+
+
+def test_get_book_handler_uses_native_s3_location():
+    """Test get_book_handler presigns from s3_bucket/s3_key when present"""
+
+    event = create_mock_event(path_params={"id": "book-a"})
+
+    mock_books_table = Mock()
+    mock_books_table.get_item.return_value = {
+        "Item": {
+            "id": "book-a",
+            "name": "Book A",
+            "s3_url": "s3://old-bucket/books/Book A.zip",
+            "s3_bucket": "test-bucket",
+            "s3_key": "books/Book A.zip",
+        }
+    }
+
+    mock_user_books_table = Mock()
+    mock_user_books_table.get_item.return_value = {}
+
+    with (
+        patch.object(config, "books_table", mock_books_table),
+        patch.object(config, "user_books_table", mock_user_books_table),
+        patch.object(config.s3_client, "generate_presigned_url", return_value="signed") as mock_generate,
+    ):
+        resp = handler.get_book_handler(event, None)
+
+    assert resp["statusCode"] == 200
+    assert mock_generate.call_args.kwargs["Params"] == {"Bucket": "test-bucket", "Key": "books/Book A.zip"}
 
 
 def test_get_book_handler_missing_id():
@@ -383,6 +1095,25 @@ def test_update_book_handler_invalid_json():
     assert "Invalid JSON" in body["message"]
 
 
+def test_update_book_handler_rejects_non_object_body():
+    """Test a JSON list body gets a 400 before any field validation or table access"""
+
+    event = create_mock_event(path_params={"id": "book-a.zip"}, body=None)
+    event["body"] = '["read", "author"]'  # type: ignore[typeddict-item]
+
+    mock_books_table = Mock()
+    mock_user_books_table = Mock()
+
+    with patch.object(config, "books_table", mock_books_table), \
+         patch.object(config, "user_books_table", mock_user_books_table):
+        resp = handler.update_book_handler(event, None)
+
+    assert resp["statusCode"] == 400
+    assert json.loads(resp["body"])["message"] == "Request body must be a JSON object"
+    assert not mock_books_table.method_calls
+    assert not mock_user_books_table.method_calls
+
+
 def test_update_book_handler_no_fields():
     """Test update_book_handler when no valid fields provided"""
 
@@ -395,6 +1126,43 @@ def test_update_book_handler_no_fields():
     assert "No valid fields to update" in body["message"]
 
 
+def test_update_book_handler_overlays_updated_attributes_on_current_item():
+    """Test author updates request only changed attributes and merge them locally"""
+
+    event = create_mock_event(
+        path_params={"id": "book-a"},
+        body={"author": "New Author", "series_order": None}
+    )
+
+    mock_books_table = Mock()
+    mock_books_table.get_item.return_value = {
+        "Item": {
+            "id": "book-a",
+            "name": "Book A",
+            "author": "Old Author",
+            "series_order": Decimal("2"),
+            "created": "2023-06-15T10:30:00Z",
+            "s3_url": "s3://test-bucket/books/Book A.zip",
+        }
+    }
+    mock_books_table.update_item.return_value = {"Attributes": {"author": "New Author"}}
+
+    mock_user_books_table = Mock()
+
+    with patch.object(config, "books_table", mock_books_table), \
+         patch.object(config, "user_books_table", mock_user_books_table), \
+         patch("gateway_backend.handlers.book_handlers.update_cover_on_author_change"):
+        resp = handler.update_book_handler(event, None)
+
+    assert resp["statusCode"] == 200
+    assert mock_books_table.update_item.call_args.kwargs["ReturnValues"] == "UPDATED_NEW"
+    body = json.loads(resp["body"])
+    assert body["author"] == "New Author"
+    assert body["created"] == "2023-06-15T10:30:00Z"
+    assert body["s3_url"] == "s3://test-bucket/books/Book A.zip"
+    assert "series_order" not in body
+
+
 def test_update_book_handler_not_found():
     """Test update_book_handler when book doesn't exist"""
 
@@ -421,6 +1189,30 @@ def test_update_book_handler_not_found():
     assert "Not Found" in body["error"]
 
 
+def test_update_book_handler_read_only_skips_metadata_update():
+    """Test a read-only PATCH writes UserBooks and fetches the book without updating Books"""
+
+    event = create_mock_event(path_params={"id": "book-a.zip"}, body={"read": True})
+
+    mock_books_table = Mock()
+    mock_books_table.get_item.return_value = {
+        "Item": {"id": "book-a.zip", "name": "Book A", "author": "Author A"}
+    }
+    mock_user_books_table = Mock()
+
+    with patch.object(config, "books_table", mock_books_table), \
+         patch.object(config, "user_books_table", mock_user_books_table):
+        resp = handler.update_book_handler(event, None)
+
+    assert resp["statusCode"] == 200
+    body = json.loads(resp["body"])
+    assert body["read"] is True
+    assert body["author"] == "Author A"
+    mock_books_table.update_item.assert_not_called()
+    mock_books_table.get_item.assert_called_once_with(Key={"id": "book-a.zip"})
+    assert mock_user_books_table.put_item.call_args.kwargs["Item"]["read"] is True
+
+
 def test_update_book_handler_invalid_read_type():
     """Test update_book_handler with invalid type for 'read' field"""
 
@@ -554,6 +1346,24 @@ def test_update_book_handler_series_order_invalid_type():
     assert "must be an integer" in body["message"]
 
 
+def test_update_book_handler_validates_every_field_before_writing():
+    """Test an invalid field alongside read is rejected before any table is touched"""
+
+    event = create_mock_event(path_params={"id": "book-a.zip"}, body={"read": True, "name": 42, "extra": "ignored"})
+
+    mock_books_table = Mock()
+    mock_user_books_table = Mock()
+
+    with patch.object(config, "books_table", mock_books_table), \
+         patch.object(config, "user_books_table", mock_user_books_table):
+        resp = handler.update_book_handler(event, None)
+
+    assert resp["statusCode"] == 400
+    assert '"name" must be a string' in json.loads(resp["body"])["message"]
+    mock_user_books_table.put_item.assert_not_called()
+    mock_books_table.update_item.assert_not_called()
+
+
 def test_update_book_handler_clear_series_order():
     """Test clearing series_order by setting it to null"""
 
@@ -606,15 +1416,15 @@ def test_list_handler_returns_books_with_series():
         ]
     }
 
-    mock_books_table = Mock()
-    mock_books_table.scan.return_value = mock_dynamodb_response
+    mock_dynamodb_client = Mock()
+    mock_dynamodb_client.scan.side_effect = segmented_scan(mock_dynamodb_response)
 
     mock_user_books_table = Mock()
     mock_user_books_table.query.return_value = {"Items": []}
 
     event = create_mock_event()
 
-    with patch.object(config, "books_table", mock_books_table), \
+    with patch.object(config, "dynamodb_client", mock_dynamodb_client), \
          patch.object(config, "user_books_table", mock_user_books_table):
         resp = handler.list_handler(event, None)
 
@@ -626,6 +1436,19 @@ def test_list_handler_returns_books_with_series():
     assert body["books"][0]["series_order"] == 1
 
 
+def test_s3_trigger_handler_returns_early_without_records():
+    """Test events without records (e.g. S3 test notifications) skip processing"""
+
+    mock_table = Mock()
+
+    with patch.object(config, "books_table", mock_table):
+        resp = handler.s3_trigger_handler({"Event": "s3:TestEvent"}, None)
+
+    assert resp["statusCode"] == 200
+    assert json.loads(resp["body"])["message"] == "No records to process"
+    mock_table.put_item.assert_not_called()
+
+
 def test_s3_trigger_handler_success():
     """Test S3 trigger handler ingests book into DynamoDB"""
 
@@ -657,6 +1480,11 @@ def test_s3_trigger_handler_success():
     assert item["size"] == 1024000
     assert item["s3_url"] == "s3://test-bucket/books/Book A.zip"
     assert item["read"] is False
+    # Partition key for the created-date index
+    assert item["entity_type"] == "book"
+    # Bucket and key are stored natively so reads don't parse s3_url
+    assert item["s3_bucket"] == "test-bucket"
+    assert item["s3_key"] == "books/Book A.zip"
 
     assert resp["statusCode"] == 200
 
@@ -690,6 +1518,52 @@ def test_s3_trigger_handler_with_author():
     assert resp["statusCode"] == 200
 
 
+def test_s3_trigger_handler_skips_redelivered_event():
+    """Test a redelivered S3 event (same sequencer) is a conditional no-op"""
+
+    from botocore.exceptions import ClientError
+
+    event = {
+        "Records": [
+            {
+                "s3": {
+                    "bucket": {"name": "test-bucket"},
+                    "object": {"key": "books/Book A.zip", "size": 1000, "sequencer": "0055AED6DCD90281E5"},
+                }
+            }
+        ]
+    }
+
+    mock_table = Mock()
+    mock_table.put_item.side_effect = ClientError(
+        {"Error": {"Code": "ConditionalCheckFailedException"}}, "PutItem"
+    )  # type: ignore[arg-type]
+
+    with patch.object(config, "books_table", mock_table), \
+         patch.object(config.s3_client, "get_object_tagging", return_value={"TagSet": []}), \
+         patch("gateway_backend.handlers.s3_handlers._fetch_cover_url", return_value=None):
+        resp = handler.s3_trigger_handler(event, None)
+
+    assert resp["statusCode"] == 200
+    put_kwargs = mock_table.put_item.call_args.kwargs
+    assert put_kwargs["Item"]["s3_sequencer"] == "0055AED6DCD90281E5"
+    assert put_kwargs["ConditionExpression"] == "attribute_not_exists(id) OR s3_sequencer <> :seq"
+    assert put_kwargs["ExpressionAttributeValues"] == {":seq": "0055AED6DCD90281E5"}
+
+
+def test_parse_filename_extracts_author_and_title():
+    """Test filename parsing splits on the first " - " and keeps the ID intact"""
+    from gateway_backend.handlers.s3_handlers import _parse_filename
+
+    assert _parse_filename("Isaac Asimov - Foundation - Book 1.zip") == (
+        "Isaac Asimov - Foundation - Book 1",
+        "Foundation - Book 1",
+        "Isaac Asimov",
+    )
+    assert _parse_filename("My_Book-Title.zip") == ("My_Book-Title", "My_Book-Title", None)
+    assert _parse_filename("") == ("", "", None)
+
+
 def test_s3_trigger_handler_multiple_records():
     """Test S3 trigger handler processes multiple S3 events"""
 
@@ -720,6 +1594,39 @@ def test_s3_trigger_handler_multiple_records():
     assert resp["statusCode"] == 200
 
 
+def test_s3_trigger_handler_multiple_records_continue_after_failure():
+    """Test records processed concurrently are independent: one failed write doesn't stop the rest"""
+
+    from botocore.exceptions import ClientError
+
+    event = {
+        "Records": [
+            {"s3": {"bucket": {"name": "test-bucket"}, "object": {"key": f"books/Book{i}.zip", "size": 1000}}}
+            for i in range(5)
+        ]
+    }
+
+    def put_item(Item):
+        if Item["id"] == "Book2":
+            raise ClientError({"Error": {"Code": "InternalServerError"}}, "PutItem")  # type: ignore[arg-type]
+
+    mock_table = Mock()
+    mock_table.put_item.side_effect = put_item
+
+    with patch.object(config, "books_table", mock_table), \
+         patch.object(config.s3_client, "get_object_tagging", return_value={"TagSet": []}), \
+         patch("gateway_backend.handlers.s3_handlers._fetch_cover_url", return_value=None):
+        resp = handler.s3_trigger_handler(event, None)
+
+    assert resp["statusCode"] == 200
+    written = {c.kwargs["Item"]["id"] for c in mock_table.put_item.call_args_list}
+    assert written == {f"Book{i}" for i in range(5)}
+    # All records of one event share a single timestamp
+    assert len({c.kwargs["Item"]["created"] for c in mock_table.put_item.call_args_list}) == 1
+    created = mock_table.put_item.call_args_list[0].kwargs["Item"]["created"]
+    assert re.fullmatch(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}Z", created)
+
+
 def test_s3_trigger_handler_skips_non_zip():
     """Test S3 trigger handler processes non-zip files (converts filename)"""
 
@@ -823,6 +1730,17 @@ def test_upload_handler_invalid_extension():
     assert "Only .zip files are allowed" in body["message"]
 
 
+def test_upload_handler_extension_check_is_case_insensitive_and_anchored():
+    """Test .ZIP is accepted while a trailing newline after .zip is rejected"""
+
+    upper = create_mock_event(is_admin=True, body={"filename": "Test Book.ZIP", "fileSize": 1024})
+    trailing = create_mock_event(is_admin=True, body={"filename": "Test Book.zip\n", "fileSize": 1024})
+
+    with patch.object(config.s3_client, "generate_presigned_url", return_value="https://example.com/upload"):
+        assert handler.upload_handler(upper, None)["statusCode"] == 200
+        assert handler.upload_handler(trailing, None)["statusCode"] == 400
+
+
 def test_upload_handler_file_too_large():
     """Test upload handler rejects files exceeding 5GB limit"""
 
@@ -914,6 +1832,34 @@ def test_upload_handler_with_s3_tags():
     assert body["series_order"] == 1
 
 
+def test_upload_handler_presigns_locally_with_credentials():
+    """Test upload URLs are signed locally with the tagging header instead of through the S3 client"""
+    from urllib.parse import parse_qs, urlsplit
+
+    from botocore.credentials import Credentials
+
+    event = create_mock_event(
+        is_admin=True,
+        body={"filename": "Test Book.zip", "fileSize": 1024000, "author": "Test Author"}
+    )
+
+    with (
+        patch.object(config, "BUCKET_NAME", "test-bucket"),
+        patch.object(config, "get_signing_credentials", return_value=Credentials("AKIDEXAMPLE", "secret")),
+        patch.object(config.s3_client, "generate_presigned_url") as mock_generate,
+    ):
+        resp = handler.upload_handler(event, None)
+
+    assert resp["statusCode"] == 200
+    body = json.loads(resp["body"])
+    parts = urlsplit(body["uploadUrl"])
+    assert parts.netloc == "test-bucket.s3.us-east-2.amazonaws.com"
+    assert parts.path == "/books/Test%20Book.zip"
+    assert parse_qs(parts.query)["X-Amz-SignedHeaders"] == ["content-type;host;x-amz-tagging"]
+    assert body["tagging"] == "author=Test+Author"
+    mock_generate.assert_not_called()
+
+
 def test_upload_handler_with_partial_tags():
     """Test upload handler handles partial metadata tags"""
 
@@ -1309,22 +2255,23 @@ def test_delete_book_handler_success():
 
     # Mock Books table
     mock_books_table = Mock()
-    mock_books_table.get_item.return_value = {
-        "Item": {
+    mock_books_table.delete_item.return_value = {
+        "Attributes": {
             "id": "Test Book",
             "name": "Test Book",
             "s3_url": "s3://test-bucket/books/Test Book.zip",
         }
     }
-    mock_books_table.delete_item.return_value = {}
 
     # Mock UserBooks table - simulate cleanup of user entries
-    mock_user_books_table = Mock()
-    mock_user_books_table.scan.return_value = {
+    mock_user_books_table = MagicMock()
+    mock_batch = mock_user_books_table.batch_writer.return_value.__enter__.return_value
+    # Both entries are found in the first scan segment
+    mock_user_books_table.scan.side_effect = lambda **kwargs: {
         "Items": [
             {"userId": "user-1", "bookId": "Test Book"},
             {"userId": "user-2", "bookId": "Test Book"}
-        ]
+        ] if kwargs["Segment"] == 0 else []
     }
 
     # Mock S3 deletion
@@ -1345,8 +2292,141 @@ def test_delete_book_handler_success():
 
     # Verify S3, UserBooks cleanup, and Books deletions were called
     mock_s3_delete.assert_called_once_with(Bucket="test-bucket", Key="books/Test Book.zip")
-    assert mock_user_books_table.delete_item.call_count == 2  # 2 users had this book
+    assert mock_batch.delete_item.call_count == 2  # 2 users had this book, deleted in one batch
+    # Without the bookId index, UserBooks is scanned in parallel segments
+    segments = sorted(call.kwargs["Segment"] for call in mock_user_books_table.scan.call_args_list)
+    assert segments == list(range(config.SCAN_TOTAL_SEGMENTS))
+    assert mock_user_books_table.scan.call_args.kwargs["ProjectionExpression"] == "userId, bookId"
     mock_books_table.delete_item.assert_called_once()
+    # The deleted item comes back from delete_item - no separate read
+    assert mock_books_table.delete_item.call_args.kwargs["ReturnValues"] == "ALL_OLD"
+    mock_books_table.get_item.assert_not_called()
+
+
+def test_delete_book_handler_queries_book_index_for_user_entries():
+    """Test UserBooks cleanup pages through the bookId index instead of scanning"""
+
+    event = create_mock_event(user_id="admin-user", is_admin=True, path_params={"id": "Test Book"})
+
+    mock_books_table = Mock()
+    mock_books_table.delete_item.return_value = {"Attributes": {"id": "Test Book"}}
+
+    mock_user_books_table = MagicMock()
+    mock_batch = mock_user_books_table.batch_writer.return_value.__enter__.return_value
+    mock_user_books_table.query.side_effect = [
+        {
+            "Items": [{"userId": "user-1", "bookId": "Test Book"}],
+            "LastEvaluatedKey": {"userId": "user-1", "bookId": "Test Book"},
+        },
+        {"Items": [{"userId": "user-2", "bookId": "Test Book"}]},
+    ]
+
+    with (
+        patch.object(config, "books_table", mock_books_table),
+        patch.object(config, "user_books_table", mock_user_books_table),
+        patch.object(config, "USER_BOOKS_BOOK_INDEX", "ByBookId"),
+    ):
+        resp = handler.delete_book_handler(event, None)
+
+    assert resp["statusCode"] == 200
+    mock_user_books_table.scan.assert_not_called()
+    first_call, second_call = mock_user_books_table.query.call_args_list
+    assert first_call.kwargs["IndexName"] == "ByBookId"
+    assert first_call.kwargs["KeyConditionExpression"] == "bookId = :bid"
+    assert second_call.kwargs["ExclusiveStartKey"] == {"userId": "user-1", "bookId": "Test Book"}
+    deleted_keys = [call.kwargs["Key"] for call in mock_batch.delete_item.call_args_list]
+    assert deleted_keys == [
+        {"userId": "user-1", "bookId": "Test Book"},
+        {"userId": "user-2", "bookId": "Test Book"},
+    ]
+
+
+def test_delete_book_handler_cleans_up_s3_and_user_books_concurrently():
+    """Test the S3 delete runs while the UserBooks cleanup is still in flight"""
+    import threading
+
+    user_books_read = threading.Event()
+
+    def find_user_books(**kwargs):
+        user_books_read.set()
+        return {"Items": []}
+
+    def delete_object(**kwargs):
+        # Only returns if the cleanup was started without waiting for this one
+        assert user_books_read.wait(timeout=5)
+
+    event = create_mock_event(user_id="admin-user", is_admin=True, path_params={"id": "Test Book"})
+
+    mock_books_table = Mock()
+    mock_books_table.delete_item.return_value = {
+        "Attributes": {"id": "Test Book", "s3_url": "s3://test-bucket/books/Test Book.zip"}
+    }
+    mock_user_books_table = Mock()
+    mock_user_books_table.scan.side_effect = find_user_books
+    mock_s3_delete = Mock(side_effect=delete_object)
+
+    with (
+        patch.object(config, "books_table", mock_books_table),
+        patch.object(config, "user_books_table", mock_user_books_table),
+        patch.object(config.s3_client, "delete_object", mock_s3_delete),
+    ):
+        resp = handler.delete_book_handler(event, None)
+
+    assert resp["statusCode"] == 200
+    mock_s3_delete.assert_called_once_with(Bucket="test-bucket", Key="books/Test Book.zip")
+
+
+def test_delete_book_handler_queues_user_books_cleanup():
+    """Test UserBooks cleanup is handed to the queue when one is configured"""
+
+    event = create_mock_event(user_id="admin-user", is_admin=True, path_params={"id": "Test Book"})
+
+    mock_books_table = Mock()
+    mock_books_table.delete_item.return_value = {"Attributes": {"id": "Test Book"}}
+    mock_user_books_table = Mock()
+    mock_sqs_client = Mock()
+
+    with (
+        patch.object(config, "books_table", mock_books_table),
+        patch.object(config, "user_books_table", mock_user_books_table),
+        patch.object(config, "sqs_client", mock_sqs_client),
+        patch.object(config, "USER_BOOKS_CLEANUP_QUEUE_URL", "https://sqs.example/cleanup"),
+    ):
+        resp = handler.delete_book_handler(event, None)
+
+    assert resp["statusCode"] == 200
+    mock_sqs_client.send_message.assert_called_once_with(
+        QueueUrl="https://sqs.example/cleanup", MessageBody=json.dumps({"bookId": "Test Book"})
+    )
+    mock_user_books_table.scan.assert_not_called()
+
+
+def test_user_books_cleanup_handler_reports_failed_messages():
+    """Test the queue consumer cleans up each book and reports only failed messages"""
+    from botocore.exceptions import ClientError
+
+    def find_user_books(**kwargs):
+        if kwargs["ExpressionAttributeValues"][":bid"] == "broken":
+            raise ClientError({"Error": {"Code": "InternalServerError"}}, "Scan")  # type: ignore[arg-type]
+        return {"Items": []}
+
+    mock_user_books_table = Mock()
+    mock_user_books_table.scan.side_effect = find_user_books
+
+    event = {
+        "Records": [
+            {"messageId": "m1", "body": json.dumps({"bookId": "Test Book"})},
+            {"messageId": "m2", "body": json.dumps({"bookId": "broken"})},
+            {"messageId": "m3", "body": "not json"},
+        ]
+    }
+
+    with patch.object(config, "user_books_table", mock_user_books_table):
+        resp = handler.user_books_cleanup_handler(event, None)
+
+    assert resp == {"batchItemFailures": [{"itemIdentifier": "m2"}, {"itemIdentifier": "m3"}]}
+    # One segmented scan per well-formed message
+    assert mock_user_books_table.scan.call_count == 2 * config.SCAN_TOTAL_SEGMENTS
 
 
 def test_delete_book_handler_requires_admin():
@@ -1384,8 +2464,12 @@ def test_delete_book_handler_book_not_found():
 
     event = create_mock_event(is_admin=True, path_params={"id": "Nonexistent Book"})
 
+    from botocore.exceptions import ClientError
+
     mock_table = Mock()
-    mock_table.get_item.return_value = {}  # No 'Item' key
+    mock_table.delete_item.side_effect = ClientError(  # type: ignore[arg-type]
+        {"Error": {"Code": "ConditionalCheckFailedException"}}, "DeleteItem"
+    )
 
     with patch.object(config, "books_table", mock_table):
         resp = handler.delete_book_handler(event, None)
@@ -1401,14 +2485,13 @@ def test_delete_book_handler_s3_error_continues():
     event = create_mock_event(is_admin=True, path_params={"id": "Test Book"})
 
     mock_books_table = Mock()
-    mock_books_table.get_item.return_value = {
-        "Item": {
+    mock_books_table.delete_item.return_value = {
+        "Attributes": {
             "id": "Test Book",
             "name": "Test Book",
             "s3_url": "s3://test-bucket/books/Test Book.zip",
         }
     }
-    mock_books_table.delete_item.return_value = {}
 
     mock_user_books_table = Mock()
     mock_user_books_table.scan.return_value = {"Items": []}
@@ -1432,20 +2515,53 @@ def test_delete_book_handler_s3_error_continues():
     mock_books_table.delete_item.assert_called_once()
 
 
+def test_delete_book_handler_s3_timeout_continues():
+    """Test a timed-out locally signed S3 DELETE is logged like a ClientError, not a 500"""
+    from botocore.credentials import Credentials
+    from urllib3.exceptions import ReadTimeoutError
+
+    from gateway_backend.handlers import admin_handlers
+
+    event = create_mock_event(is_admin=True, path_params={"id": "Test Book"})
+
+    mock_books_table = Mock()
+    mock_books_table.delete_item.return_value = {
+        "Attributes": {"id": "Test Book", "s3_url": "s3://test-bucket/books/Test Book.zip"}
+    }
+    mock_user_books_table = Mock()
+    mock_user_books_table.scan.return_value = {"Items": []}
+
+    with (
+        patch.object(config, "books_table", mock_books_table),
+        patch.object(config, "user_books_table", mock_user_books_table),
+        patch.object(
+            config, "get_signing_credentials", return_value=Credentials("AKIDEXAMPLE", "secret")
+        ),
+        patch.object(
+            admin_handlers,
+            "delete_object",
+            side_effect=ReadTimeoutError(None, "/books/Test Book.zip", "Read timed out."),
+        ) as mock_delete,
+    ):
+        resp = handler.delete_book_handler(event, None)
+
+    assert resp["statusCode"] == 200
+    mock_delete.assert_called_once()
+
+
 def test_delete_book_handler_no_s3_url():
     """Test delete handler works when book has no S3 URL"""
 
     event = create_mock_event(is_admin=True, path_params={"id": "Test Book"})
 
     mock_books_table = Mock()
-    mock_books_table.get_item.return_value = {
-        "Item": {
+    mock_books_table.delete_item.return_value = {
+        "Attributes": {
             "id": "Test Book",
             "name": "Test Book",
             # No s3_url
         }
     }
-    mock_books_table.delete_item.return_value = {}
 
     mock_user_books_table = Mock()
     mock_user_books_table.scan.return_value = {"Items": []}
@@ -1469,19 +2585,11 @@ def test_delete_book_handler_no_s3_url():
 
 
 def test_delete_book_handler_dynamodb_not_found_on_delete():
-    """Test delete handler handles race condition where book deleted between get and delete"""
+    """Test delete handler leaves S3 and UserBooks alone when the conditional delete fails"""
 
     event = create_mock_event(is_admin=True, path_params={"id": "Test Book"})
 
     mock_books_table = Mock()
-    mock_books_table.get_item.return_value = {
-        "Item": {
-            "id": "Test Book",
-            "name": "Test Book",
-            "s3_url": "s3://test-bucket/books/Test Book.zip",
-        }
-    }
-
     # Simulate ConditionalCheckFailedException during delete
     from botocore.exceptions import ClientError
 
@@ -1504,6 +2612,8 @@ def test_delete_book_handler_dynamodb_not_found_on_delete():
     assert resp["statusCode"] == 404
     body = json.loads(resp["body"])
     assert "not found" in body["message"]
+    mock_s3_delete.assert_not_called()
+    mock_user_books_table.scan.assert_not_called()
 
 
 def test_get_book_handler_with_apostrophe_in_id():
@@ -1626,8 +2736,8 @@ def test_delete_book_handler_with_apostrophe_in_id():
     event = create_mock_event(is_admin=True, path_params={"id": book_id})
 
     mock_books_table = Mock()
-    mock_books_table.get_item.return_value = {
-        "Item": {
+    mock_books_table.delete_item.return_value = {
+        "Attributes": {
             "id": book_id,
             "name": "Roald Dahl's Cookbook.epub",
             "s3_url": f"s3://test-bucket/books/{book_id}",
@@ -2080,14 +3190,13 @@ def test_delete_book_handler_user_books_scan_error():
     event = create_mock_event(is_admin=True, path_params={"id": "test-book.zip"})
 
     mock_books_table = Mock()
-    mock_books_table.get_item.return_value = {
-        "Item": {
+    mock_books_table.delete_item.return_value = {
+        "Attributes": {
             "id": "test-book.zip",
             "name": "Test Book",
             "s3_url": "s3://bucket/books/test-book.zip",
         }
     }
-    mock_books_table.delete_item.return_value = {}
 
     mock_user_books_table = Mock()
     mock_user_books_table.scan.side_effect = ClientError(
@@ -2112,7 +3221,7 @@ def test_delete_book_handler_general_error():
     event = create_mock_event(is_admin=True, path_params={"id": "test-book.zip"})
 
     mock_books_table = Mock()
-    mock_books_table.get_item.side_effect = Exception("Unexpected error")
+    mock_books_table.delete_item.side_effect = Exception("Unexpected error")
 
     mock_user_books_table = Mock()
 
@@ -2323,9 +3432,12 @@ def test_set_upload_metadata_handler_author_no_change_no_fetch():
         resp = handler.set_upload_metadata_handler(event, None)
 
     assert resp["statusCode"] == 200
+    assert json.loads(resp["body"])["author"] == "Isaac Asimov"
 
     # Verify fetch_cover_url was NOT called
     mock_fetch.assert_not_called()
+    # Nothing differs from the stored record, so nothing is written
+    mock_table.update_item.assert_not_called()
 
 
 def test_set_upload_metadata_handler_author_change_no_cover_found():
@@ -2410,15 +3522,15 @@ def test_list_handler_returns_cover_urls():
         ]
     }
 
-    mock_books_table = Mock()
-    mock_books_table.scan.return_value = mock_dynamodb_response
+    mock_dynamodb_client = Mock()
+    mock_dynamodb_client.scan.side_effect = segmented_scan(mock_dynamodb_response)
 
     mock_user_books_table = Mock()
     mock_user_books_table.query.return_value = {"Items": []}
 
     event = create_mock_event()
 
-    with patch.object(config, "books_table", mock_books_table), \
+    with patch.object(config, "dynamodb_client", mock_dynamodb_client), \
          patch.object(config, "user_books_table", mock_user_books_table):
         resp = handler.list_handler(event, None)
 